@@ -15,7 +15,7 @@ from PySide6.QtCore import Signal, Qt, QThread
 from PySide6.QtGui import QPixmap, QCursor
 
 from core.app import get_app_state
-from schemas.poetry import PoetryPromptsResponse
+from schemas.poetry import PoetryPromptsResponse, VersePrompts
 
 
 class ImageGalleryPage(QWidget):
@@ -41,6 +41,7 @@ class ImageGalleryPage(QWidget):
 
         self.app_state = get_app_state()
         self.prompts: Optional[PoetryPromptsResponse] = None
+        self._verse_by_index: Dict[int, VersePrompts] = {}  # 诗句索引 -> 诗句提示词
         self.generated_images: Dict[tuple, dict] = {}  # (verse_index, prompt_index) -> {path, video_prompt, description}
         self.selected_images: set = set()  # 选中的图片索引
 
@@ -223,6 +224,10 @@ class ImageGalleryPage(QWidget):
     def set_prompts(self, prompts: PoetryPromptsResponse):
         """设置提示词数据"""
         self.prompts = prompts
+        # 与 PoetryPromptsResponse.get_verse 一致：索引重复时取第一个
+        self._verse_by_index = {}
+        for verse in (prompts.prompts if prompts else []):
+            self._verse_by_index.setdefault(verse.index, verse)
         self.generate_btn.setEnabled(True)
         
         # Check for grid prompt
@@ -427,7 +432,7 @@ class ImageGalleryPage(QWidget):
                 }
             """)
         else:
-            verse = self.prompts.get_verse(verse_index) if self.prompts else None
+            verse = self._verse_by_index.get(verse_index)
             if verse:
                 label_text = f"{verse.verse[:15]}... #{prompt_index + 1}"
             else:
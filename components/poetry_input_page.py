@@ -3,11 +3,16 @@
 用户输入诗词，解析诗句，选择风格
 """
 import re
+import json
+import logging
+import math
+from functools import lru_cache
+from itertools import chain
 from typing import List, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout,
-    QTextEdit, QPushButton, QLabel, QComboBox,
-    QGroupBox, QScrollArea, QMessageBox
+    QTextEdit, QPlainTextEdit, QPushButton, QLabel, QComboBox,
+    QGroupBox, QMessageBox
 )
 from PySide6.QtCore import Signal, Qt, QThread
 from PySide6.QtGui import QFont
@@ -15,7 +20,248 @@ from PySide6.QtGui import QFont
 from core.app import get_app_state
 from config.api_config import Models
 from utils.style_anchor import StylePreset
-from schemas.poetry import PoetryPromptsResponse, VersePrompts, ImagePrompt
+from schemas.poetry import PoetryPromptsResponse, VersePrompts, ImagePrompt, MusicPrompt
+
+
+logger = logging.getLogger(__name__)
+
+# 诗句分隔标点
+_VERSE_PUNCT = '。！？；，、'
+_PUNCT_TRANS = str.maketrans({c: '\n' for c in _VERSE_PUNCT})
+
+# LLM 响应 JSON 解码/修复
+# JSONDecoder 无内部可变状态，可在各生成线程间共享
+_JSON_DECODER = json.JSONDecoder()
+
+# orjson 为可选依赖，未安装时退回标准库
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+_TRAIL_COMMA_OBJ = re.compile(r',\s*\}')
+_TRAIL_COMMA_ARR = re.compile(r',\s*\]')
+
+# 完整的风格映射（包含所有 ART_STYLES）
+_PRESET_MAP = {
+    'ink': StylePreset.CHINESE_INK,
+    'watercolor': StylePreset.CHINESE_WATERCOLOR,
+    'gongbi': StylePreset.GONGBI,
+    'oil': {
+        'description': 'Western oil painting style with rich textures, vivid colors, thick brush strokes, and dramatic lighting, reminiscent of classical European art'
+    },
+    'anime': {
+        'description': 'Japanese anime art style with vibrant colors, expressive characters, clean lines, cel-shaded rendering, and dramatic atmospheric effects'
+    },
+    'realistic': {
+        'description': 'Photo-realistic style with accurate details, natural lighting, realistic textures, true-to-life colors, and precise spatial depth'
+    },
+    'abstract': {
+        'description': 'Abstract art style with non-representational forms, bold color blocks, geometric shapes, emotional expression through color and composition'
+    },
+    'minimalist': {
+        'description': 'Minimalist design with clean composition, limited color palette, essential elements only, negative space emphasis, modern aesthetic'
+    }
+}
+
+# 示例诗词
+_EXAMPLE_POEM = "春苑月裴回\n竹堂侵夜开\n惊鸟排林度\n风花隔水来"
+
+
+# 描述提取函数，兼容两种格式：
+# 1. 新格式: {"image": "...", "video": "..."}
+# 2. 旧格式: "纯字符串"
+def _extract_dict(desc: dict) -> tuple:
+    """从字典格式描述中提取 (图像提示词, 视频提示词)"""
+    return desc.get("image", desc.get("description", "")), desc.get("video", "")
+
+
+def _extract_str(desc) -> tuple:
+    """从字符串格式描述中提取 (图像提示词, 视频提示词)"""
+    return str(desc), ""
+
+
+@lru_cache(maxsize=8)
+def _descriptions_template(example_count: int) -> str:
+    """生成系统提示词中的 JSON descriptions 模板示例（按示例数量缓存）"""
+    return ",\n".join(
+        f"""        {{
+          "image": "Image Prompt {i} (English)...",
+          "video": "Video Prompt {i} (English)..."
+        }}"""
+        for i in range(1, max(example_count, 1) + 1)
+    )
+
+
+# 系统提示词静态部分（JSON descriptions 模板前后）
+_SYS_PROMPT_PREFIX = """你是一个专业的中国古典诗词视觉艺术家和视频导演。请根据以下诗句同时生成高质量的图像提示词和专业的视频提示词。
+
+## 图像提示词要求
+每个图像描述必须包含：
+1. 艺术风格（如 traditional Chinese ink painting, watercolor）
+2. 构图说明（如 wide shot, close-up, bird's eye view）
+3. 光影氛围（如 soft morning light, moonlit, golden hour）
+4. 文化元素（如 red lanterns, calligraphy, bamboo, plum blossoms）
+5. 色彩方案（如 muted earth tones, vibrant reds and golds）
+
+## 视频提示词要求
+每个视频描述必须是专业的动画制作提示词，包含：
+1. **运镜方式** (Camera Movement):
+   - 缓慢推拉 (slow push in/pull out)
+   - 横移/跟随 (pan/track)
+   - 摇摄 (tilt)
+   - 环绕 (orbit)
+   - 升降 (crane/bird's eye)
+
+2. **动画风格** (Animation Style):
+   - 水墨流动效果 (ink flow animation)
+   - 水彩晕染扩散 (watercolor spread)
+   - 传统动画帧 (traditional frame-by-frame)
+   - 3D 粒子效果 (3D particle effects)
+
+3. **转场效果** (Transition):
+   - 淡入淡出 (fade)
+   - 墨色散开 (ink dissolve)
+   - 云雾缭绕 (mist transition)
+   - 花瓣飘落 (petal cascade)
+
+4. **节奏与时长** (Pace & Duration):
+   - 缓慢宁静 (slow and serene)
+   - 流畅连贯 (smooth flow)
+   - 建议秒数 (5-10 seconds)
+
+5. **动态元素** (Motion Elements):
+   - 风吹柳枝 (willow swaying)
+   - 水波荡漾 (water rippling)
+   - 云卷云舒 (clouds drifting)
+   - 落花纷飞 (falling petals)
+
+请以 JSON 格式返回：
+{
+  "prompts": [
+    {
+      "verse": "诗句原文",
+      "index": 0,
+      "descriptions": [
+"""
+
+_SYS_PROMPT_SUFFIX = """
+      ]
+    }
+  ]
+}"""
+
+# 音乐生成部分
+_MUSIC_PROMPT_ADDITION = """
+
+## 音乐提示词 (Suno AI)
+同时为整首诗生成一个专业的 Suno AI 音乐提示词。
+
+### Style Prompt 格式
+用逗号分隔的标签，按重要性排序：
+[Genre] > [Vocal Style] > [Mood/Atmosphere] > [Tempo/Rhythm] > [Instrumentation]
+
+示例风格：
+- 古风：`Traditional Chinese, Guzheng, Erhu, Ethereal Female Vocals, Melancholic, Slow, Atmospheric`
+- 现代融合：`Cinematic, Orchestral, Chinese Folk Elements, Female Choir, Epic, Emotional`
+
+### 歌词结构
+使用 Suno 标签：
+- `[Intro]` - 开场引入
+- `[Verse]` - 诗句段落
+- `[Chorus]` - 副歌高潮
+- `[Bridge]` - 过渡段
+- `[Outro]` - 结尾
+
+完整 JSON 格式：
+{
+  "prompts": [...图像视频提示词...],
+  "music": {
+    "style_prompt": "Traditional Chinese, Guzheng, Erhu, Ethereal Female Vocals, Melancholic, Slow tempo, Atmospheric, Lo-fi",
+    "title": "基于诗词的歌曲标题",
+    "lyrics_cn": "[Verse]\\n诗句1\\n诗句2\\n\\n[Chorus]\\n诗句3\\n诗句4",
+    "lyrics_en": "[Verse]\\nEnglish translation line 1\\nEnglish translation line 2\\n\\n[Chorus]\\nEnglish translation line 3\\nEnglish translation line 4",
+    "instrumental": false
+  }
+}"""
+
+
+@lru_cache(maxsize=8)
+def _full_system_prompt(example_count: int) -> str:
+    """构建完整系统提示词（图像/视频 + 音乐），按示例数量缓存"""
+    return (_SYS_PROMPT_PREFIX + _descriptions_template(example_count)
+            + _SYS_PROMPT_SUFFIX + _MUSIC_PROMPT_ADDITION)
+
+
+def _grid_layout(count: int) -> tuple:
+    """计算网格布局 (行, 列)"""
+    if count <= 0:
+        return 1, 1
+
+    # 特殊规则
+    if count == 3:
+        return 1, 3  # 1x3 长条
+    if count == 5:
+        return 1, 5  # 1x5 长条
+
+    # 默认尝试接近正方形的布局 (2x2, 2x3, 3x3)
+    n = int(math.ceil(math.sqrt(count)))
+    m = int(math.ceil(count / n))
+
+    return m, n  # 行, 列 (m*n) 或者 n*m，根据用户习惯通常是 行x列 或者 列x行。
+                 # 用户描述: "1*3" usually means 1 row 3 cols or 1 col 3 rows?
+                 # let's assume Row x Col.
+                 # Users said: "3 or 5 can be 1*3". This likely means 1 Row, 3 Cols (Horizontal Strip).
+                 # I will return (1, count) for 3 and 5.
+
+
+# 常见镜头数 (5 句 x 5 示例以内) 的网格布局查找表
+_GRID_LAYOUT = {count: _grid_layout(count) for count in range(1, 26)}
+
+
+def _parse_llm_json(response: str) -> dict:
+    """
+    从 LLM 响应中提取并解析 JSON
+
+    Args:
+        response: LLM 原始响应文本
+
+    Returns:
+        解析后的 JSON 对象
+
+    Raises:
+        ValueError: 无法解析为 JSON
+    """
+    # 1. 去掉 markdown 代码块 ```json ... ``` 围栏
+    text = response
+    _, fence, body = text.partition('```json')
+    if fence:
+        text = body.partition('```')[0]
+
+    # 2. 从第一个 { 开始线性解码，尾部多余文字由 raw_decode 忽略
+    start = text.find('{')
+    if start == -1:
+        raise ValueError(f"无法解析 JSON 响应: 未找到 JSON 对象\nRaw response: {response[:200]}...")
+
+    # 3. 优先按最外层 {} 整体快速解析（orjson 可用时）
+    end = text.rfind('}')
+    if end > start:
+        try:
+            return _loads(text[start:end + 1])
+        except ValueError:
+            pass
+
+    try:
+        return _JSON_DECODER.raw_decode(text, start)[0]
+    except json.JSONDecodeError as e:
+        # 如果解析失败，尝试修复常见的 JSON 格式错误 (如末尾逗号)
+        try:
+            # 简单的修复尝试：移除末尾逗号
+            fixed_str = _TRAIL_COMMA_OBJ.sub('}', text[start:])
+            fixed_str = _TRAIL_COMMA_ARR.sub(']', fixed_str)
+            return _JSON_DECODER.raw_decode(fixed_str)[0]
+        except Exception:
+            raise ValueError(f"无法解析 JSON 响应: {e}\nRaw response: {response[:200]}...")
 
 
 class PoetryInputPage(QWidget):
@@ -29,7 +275,7 @@ class PoetryInputPage(QWidget):
     4. 生成提示词
     """
 
-    verses_parsed = Signal(list)  # 解析诗句信号
+    verses_parsed = Signal(tuple)  # 解析诗句信号（不可变快照）
     prompts_generated = Signal(object)  # 生成提示词信号
 
     def __init__(self, parent=None):
@@ -38,6 +284,7 @@ class PoetryInputPage(QWidget):
         self.app_state = get_app_state()
         self.verses: List[str] = []
         self.prompts: Optional[PoetryPromptsResponse] = None
+        self._cached_text: Optional[str] = None  # 输入文本缓存，文本变化时失效
 
         self._init_ui()
 
@@ -91,6 +338,7 @@ class PoetryInputPage(QWidget):
             "风花隔水来"
         )
         self.text_edit.setMinimumHeight(300)
+        self.text_edit.textChanged.connect(self._on_text_changed)
         layout.addWidget(self.text_edit)
 
         # 示例按钮
@@ -202,18 +450,15 @@ class PoetryInputPage(QWidget):
         group = QGroupBox("解析结果")
         layout = QVBoxLayout(group)
 
-        # 创建滚动区域
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setMaximumHeight(200)
-
-        self.result_label = QLabel("等待解析诗句...")
-        self.result_label.setWordWrap(True)
-        self.result_label.setAlignment(Qt.AlignTop)
+        # 只读纯文本控件（自带滚动，按行惰性布局）
+        self.result_label = QPlainTextEdit()
+        self.result_label.setReadOnly(True)
+        self.result_label.setUndoRedoEnabled(False)
+        self.result_label.setMaximumBlockCount(5000)
+        self.result_label.setPlainText("等待解析诗句...")
         self.result_label.setMinimumHeight(150)
-
-        scroll.setWidget(self.result_label)
-        layout.addWidget(scroll)
+        self.result_label.setMaximumHeight(200)
+        layout.addWidget(self.result_label)
 
         return group
 
@@ -226,32 +471,34 @@ class PoetryInputPage(QWidget):
 
     def _load_example(self):
         """加载示例诗词"""
-        examples = [
-            """春苑月裴回
-竹堂侵夜开
-惊鸟排林度
-风花隔水来""",
-        ]
+        self.text_edit.setText(_EXAMPLE_POEM)
+
+    def _on_text_changed(self):
+        """输入文本变化：仅使缓存失效，读取时再序列化"""
+        self._cached_text = None
 
-        import random
-        self.text_edit.setText(random.choice(examples))
+    def _plain_text(self) -> str:
+        """获取输入文本（未编辑时复用上次结果）"""
+        if self._cached_text is None:
+            self._cached_text = self.text_edit.toPlainText()
+        return self._cached_text
 
     def _clear_text(self):
         """清空文本"""
         self.text_edit.clear()
         self.verses = []
-        self.result_label.setText("等待解析诗句...")
+        self.result_label.setPlainText("等待解析诗句...")
         self.generate_btn.setEnabled(False)
 
     def _parse_verses(self):
         """解析诗句"""
-        text = self.text_edit.toPlainText().strip()
+        text = self._plain_text()
 
-        if not text:
+        if not text or text.isspace():
             QMessageBox.warning(self, "输入错误", "请输入诗词内容")
             return
 
-        # 规则解析
+        # 规则解析（各片段自行 strip，无需先复制一份去空白的文本）
         self.verses = self._parse_poetry_text(text)
 
         if not self.verses:
@@ -259,14 +506,14 @@ class PoetryInputPage(QWidget):
             return
 
         # 显示结果
-        result_text = f"共解析出 {len(self.verses)} 句诗：\n\n"
-        for i, verse in enumerate(self.verses):
-            result_text += f"{i + 1}. {verse}\n"
+        result_text = f"共解析出 {len(self.verses)} 句诗：\n\n" + "".join(
+            f"{i + 1}. {verse}\n" for i, verse in enumerate(self.verses)
+        )
 
-        self.result_label.setText(result_text)
+        self.result_label.setPlainText(result_text)
         self.generate_btn.setEnabled(True)
 
-        self.verses_parsed.emit(self.verses)
+        self.verses_parsed.emit(tuple(self.verses))
 
     def _parse_poetry_text(self, text: str) -> List[str]:
         """
@@ -278,22 +525,10 @@ class PoetryInputPage(QWidget):
         3. 按标点符号（。！？；，、）分割长行
         4. 过滤少于 2 个字符的行
         """
-        lines = text.strip().split('\n')
-        verses = []
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # 按标点分割
-            parts = re.split(r'[。！？；，、]', line)
-            for part in parts:
-                part = part.strip()
-                if len(part) >= 2:
-                    verses.append(part)
-
-        return verses
+        # 标点统一替换为换行，一次分割即可（无标点时等价于按行分割）
+        # 每个片段各自 strip，无需再对整段文本预先 strip
+        parts = (p.strip() for p in text.translate(_PUNCT_TRANS).split('\n'))
+        return [p for p in parts if len(p) >= 2]
 
     def _generate_prompts(self):
         """生成提示词（在后台线程中）"""
@@ -306,10 +541,14 @@ class PoetryInputPage(QWidget):
         custom_style = self.custom_style_edit.toPlainText().strip()
         example_count = self.example_count_spin.currentData()
         
-        # Grid Mode params
-        grid_mode = self.grid_mode_group.isChecked()
-        resolution = self.resolution_combo.currentText()
-        aspect_ratio = self.aspect_ratio_combo.currentText()
+        # Grid Mode params（仅在九宫格模式开启时读取）
+        grid_kwargs = {}
+        if self.grid_mode_group.isChecked():
+            grid_kwargs = {
+                "grid_mode": True,
+                "resolution": self.resolution_combo.currentText(),
+                "aspect_ratio": self.aspect_ratio_combo.currentText(),
+            }
 
         # 启动生成线程
         self.generate_btn.setEnabled(False)
@@ -322,9 +561,7 @@ class PoetryInputPage(QWidget):
             custom_style,
             example_count,
             self.use_anchors_check.isChecked(),
-            grid_mode=grid_mode,
-            resolution=resolution,
-            aspect_ratio=aspect_ratio
+            **grid_kwargs
         )
         self._generation_thread.finished.connect(self._on_generation_complete)
         self._generation_thread.error.connect(self._on_generation_error)
@@ -366,16 +603,19 @@ class PoetryInputPage(QWidget):
         self.verses = [v.verse for v in prompts.prompts]
 
         # 更新显示
-        result_text = f"共 {len(prompts.prompts)} 句诗，{prompts.total_prompts()} 个提示词\n\n"
-        for verse_prompt in prompts.prompts:
-            result_text += f"{verse_prompt.verse}: {len(verse_prompt.descriptions)} 个提示词\n"
+        lines = [
+            f"{verse_prompt.verse}: {len(verse_prompt.descriptions)} 个提示词\n"
+            for verse_prompt in prompts.prompts
+        ]
+        total = sum(len(verse_prompt.descriptions) for verse_prompt in prompts.prompts)
+        result_text = f"共 {len(lines)} 句诗，{total} 个提示词\n\n" + "".join(lines)
 
-        self.result_label.setText(result_text)
+        self.result_label.setPlainText(result_text)
         self.generate_btn.setEnabled(True)
 
     def get_poetry_text(self) -> str:
         """获取当前输入的诗词文本"""
-        return self.text_edit.toPlainText().strip()
+        return self._plain_text().strip()
 
 
 class PromptGenerationThread(QThread):
@@ -405,33 +645,12 @@ class PromptGenerationThread(QThread):
         """运行生成任务"""
         try:
             # 构建提示词模板
-            style_preset = StylePreset()
             style_desc = ""
 
             if self.art_style:
-                # 完整的风格映射（包含所有 ART_STYLES）
-                preset_map = {
-                    'ink': style_preset.CHINESE_INK,
-                    'watercolor': style_preset.CHINESE_WATERCOLOR,
-                    'gongbi': style_preset.GONGBI,
-                    'oil': {
-                        'description': 'Western oil painting style with rich textures, vivid colors, thick brush strokes, and dramatic lighting, reminiscent of classical European art'
-                    },
-                    'anime': {
-                        'description': 'Japanese anime art style with vibrant colors, expressive characters, clean lines, cel-shaded rendering, and dramatic atmospheric effects'
-                    },
-                    'realistic': {
-                        'description': 'Photo-realistic style with accurate details, natural lighting, realistic textures, true-to-life colors, and precise spatial depth'
-                    },
-                    'abstract': {
-                        'description': 'Abstract art style with non-representational forms, bold color blocks, geometric shapes, emotional expression through color and composition'
-                    },
-                    'minimalist': {
-                        'description': 'Minimalist design with clean composition, limited color palette, essential elements only, negative space emphasis, modern aesthetic'
-                    }
-                }
-                if self.art_style in preset_map:
-                    style_desc = preset_map[self.art_style]['description']
+                preset = _PRESET_MAP.get(self.art_style)
+                if preset:
+                    style_desc = preset['description']
 
             if self.custom_style:
                 if style_desc:
@@ -442,76 +661,6 @@ class PromptGenerationThread(QThread):
             verses_text = "\n".join(f"{i + 1}. {v}" for i, v in enumerate(self.verses))
 
 
-            # 动态生成 JSON 模板示例
-            json_descriptions_template = """        {
-          "image": "Image Prompt 1 (English)...",
-          "video": "Video Prompt 1 (English)..."
-        }"""
-            
-            # 如果需要多个示例，就在模板中展示多个
-            if self.example_count > 1:
-                for i in range(2, self.example_count + 1):
-                    json_descriptions_template += f""",
-        {{
-          "image": "Image Prompt {i} (English)...",
-          "video": "Video Prompt {i} (English)..."
-        }}"""
-
-            sys_prompt_content = f"""你是一个专业的中国古典诗词视觉艺术家和视频导演。请根据以下诗句同时生成高质量的图像提示词和专业的视频提示词。
-
-## 图像提示词要求
-每个图像描述必须包含：
-1. 艺术风格（如 traditional Chinese ink painting, watercolor）
-2. 构图说明（如 wide shot, close-up, bird's eye view）
-3. 光影氛围（如 soft morning light, moonlit, golden hour）
-4. 文化元素（如 red lanterns, calligraphy, bamboo, plum blossoms）
-5. 色彩方案（如 muted earth tones, vibrant reds and golds）
-
-## 视频提示词要求
-每个视频描述必须是专业的动画制作提示词，包含：
-1. **运镜方式** (Camera Movement):
-   - 缓慢推拉 (slow push in/pull out)
-   - 横移/跟随 (pan/track)
-   - 摇摄 (tilt)
-   - 环绕 (orbit)
-   - 升降 (crane/bird's eye)
-
-2. **动画风格** (Animation Style):
-   - 水墨流动效果 (ink flow animation)
-   - 水彩晕染扩散 (watercolor spread)
-   - 传统动画帧 (traditional frame-by-frame)
-   - 3D 粒子效果 (3D particle effects)
-
-3. **转场效果** (Transition):
-   - 淡入淡出 (fade)
-   - 墨色散开 (ink dissolve)
-   - 云雾缭绕 (mist transition)
-   - 花瓣飘落 (petal cascade)
-
-4. **节奏与时长** (Pace & Duration):
-   - 缓慢宁静 (slow and serene)
-   - 流畅连贯 (smooth flow)
-   - 建议秒数 (5-10 seconds)
-
-5. **动态元素** (Motion Elements):
-   - 风吹柳枝 (willow swaying)
-   - 水波荡漾 (water rippling)
-   - 云卷云舒 (clouds drifting)
-   - 落花纷飞 (falling petals)
-
-请以 JSON 格式返回：
-{{
-  "prompts": [
-    {{
-      "verse": "诗句原文",
-      "index": 0,
-      "descriptions": [
-{json_descriptions_template}
-      ]
-    }}
-  ]
-}}"""
-
             user_prompt = f"""## 诗句
 {verses_text}
 
@@ -537,42 +686,8 @@ class PromptGenerationThread(QThread):
 
 请严格按照上述 JSON 格式返回，不要添加任何其他文字。"""
 
-            # 更新系统提示词以包含音乐生成
-            music_prompt_addition = """
-
-## 音乐提示词 (Suno AI)
-同时为整首诗生成一个专业的 Suno AI 音乐提示词。
-
-### Style Prompt 格式
-用逗号分隔的标签，按重要性排序：
-[Genre] > [Vocal Style] > [Mood/Atmosphere] > [Tempo/Rhythm] > [Instrumentation]
-
-示例风格：
-- 古风：`Traditional Chinese, Guzheng, Erhu, Ethereal Female Vocals, Melancholic, Slow, Atmospheric`
-- 现代融合：`Cinematic, Orchestral, Chinese Folk Elements, Female Choir, Epic, Emotional`
-
-### 歌词结构
-使用 Suno 标签：
-- `[Intro]` - 开场引入
-- `[Verse]` - 诗句段落
-- `[Chorus]` - 副歌高潮
-- `[Bridge]` - 过渡段
-- `[Outro]` - 结尾
-
-完整 JSON 格式：
-{
-  "prompts": [...图像视频提示词...],
-  "music": {
-    "style_prompt": "Traditional Chinese, Guzheng, Erhu, Ethereal Female Vocals, Melancholic, Slow tempo, Atmospheric, Lo-fi",
-    "title": "基于诗词的歌曲标题",
-    "lyrics_cn": "[Verse]\\n诗句1\\n诗句2\\n\\n[Chorus]\\n诗句3\\n诗句4",
-    "lyrics_en": "[Verse]\\nEnglish translation line 1\\nEnglish translation line 2\\n\\n[Chorus]\\nEnglish translation line 3\\nEnglish translation line 4",
-    "instrumental": false
-  }
-}"""
-
-            # 将音乐提示词添加到系统提示词
-            full_system_prompt = sys_prompt_content + music_prompt_addition
+            # 系统提示词（含音乐生成部分）只随示例数量变化
+            full_system_prompt = _full_system_prompt(self.example_count)
 
             # 调用 LLM
             client = self.app_state.llm_client
@@ -582,60 +697,28 @@ class PromptGenerationThread(QThread):
                 temperature=0.8
             )
 
+            # 记录原始响应以便调试（仅 DEBUG 级别）
+            logger.debug("LLM Response: %s", response)
+
             # 解析 JSON 响应
-            import json
-            import logging
-            
-            # 记录原始响应以便调试
-            print(f"LLM Response: {response}")
-            
-            # 尝试提取 JSON
-            # 1. 尝试匹配 markdown 代码块 ```json ... ```
-            json_match = re.search(r'```json\s*(\{[\s\S]*?\})\s*```', response)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # 2. 尝试匹配最外层的 {}
-                json_match = re.search(r'\{[\s\S]*\}', response)
-                if json_match:
-                    json_str = json_match.group(0)
-                else:
-                    # 3. 都没有匹配到，尝试直接解析整个响应
-                    json_str = response
-
-            try:
-                data = json.loads(json_str)
-            except json.JSONDecodeError as e:
-                # 如果解析失败，尝试修复常见的 JSON 格式错误 (如末尾逗号)
-                try:
-                    # 简单的修复尝试：移除末尾逗号
-                    fixed_str = re.sub(r',\s*\}', '}', json_str)
-                    fixed_str = re.sub(r',\s*\]', ']', fixed_str)
-                    data = json.loads(fixed_str)
-                except Exception:
-                    raise ValueError(f"无法解析 JSON 响应: {e}\nRaw response: {response[:200]}...")
+            data = _parse_llm_json(response)
 
             # 构建响应对象
-            from schemas.poetry import MusicPrompt
             prompts = PoetryPromptsResponse()
             
             for item in data.get("prompts", []):
-                verse_prompts = []
-                for desc in item.get("descriptions", []):
-                    # 兼容两种格式：
-                    # 1. 新格式: {"image": "...", "video": "..."}
-                    # 2. 旧格式: "纯字符串"
-                    if isinstance(desc, dict):
-                        image_desc = desc.get("image", desc.get("description", ""))
-                        video_desc = desc.get("video", "")
-                    else:
-                        image_desc = str(desc)
-                        video_desc = ""
-
-                    verse_prompts.append(
-                        ImagePrompt(description=image_desc, video_prompt=video_desc)
+                descs = item.get("descriptions", [])
+                # LLM 输出可能混合字典和字符串，逐项选择提取函数
+                # ImagePrompt 仍走校验：LLM 输出需经长度检查与 strip
+                verse_prompts = [
+                    ImagePrompt(description=image_desc, video_prompt=video_desc)
+                    for image_desc, video_desc in (
+                        (_extract_dict if isinstance(d, dict) else _extract_str)(d) for d in descs
                     )
+                ]
 
+                # verse / index 来自 LLM 输出，仍需校验（index >= 0）；
+                # descriptions 已是 ImagePrompt 实例，pydantic 默认不会重复校验
                 verse = VersePrompts(
                     verse=item["verse"],
                     index=item["index"],
@@ -657,11 +740,9 @@ class PromptGenerationThread(QThread):
             # --- 九宫格提示词生成逻辑 ---
             if self.grid_mode and prompts.prompts:
                 # 获取所有提示词（包括多示例）
-                image_prompts = []
-                for v in prompts.prompts:
-                    if v.descriptions:
-                        for d in v.descriptions:
-                            image_prompts.append(d.description)
+                image_prompts = list(chain.from_iterable(
+                    (d.description for d in v.descriptions) for v in prompts.prompts
+                ))
                 
                 count = len(image_prompts)
                 if count > 0:
@@ -671,14 +752,14 @@ class PromptGenerationThread(QThread):
                     # 更好的做法可能只是列出诗句一次，但 prompt 数量匹配
                     poem_summary = " ".join([v.verse for v in prompts.prompts])
                     
-                    grid_prompt = f"根据【{poem_summary}】，生成一张具有凝聚力的[{n}*{m}]的网格图像（包含{count}个镜头），"
-                    grid_prompt += f"严格保持人物/物体服装光线的一致性，[{self.resolution}]分辨率，[{self.aspect_ratio}]画幅。"
-                    grid_prompt += "生成的多宫格图每一个分镜头都需要按照序号编号。\n\n"
-                    
-                    for i, prompt in enumerate(image_prompts):
-                        grid_prompt += f"镜头{i+1}: [{prompt}]\n"
-                    
-                    prompts.grid_prompt = grid_prompt
+                    parts = [
+                        f"根据【{poem_summary}】，生成一张具有凝聚力的[{n}*{m}]的网格图像（包含{count}个镜头），",
+                        f"严格保持人物/物体服装光线的一致性，[{self.resolution}]分辨率，[{self.aspect_ratio}]画幅。",
+                        "生成的多宫格图每一个分镜头都需要按照序号编号。\n\n",
+                    ]
+                    parts.extend(f"镜头{i+1}: [{prompt}]\n" for i, prompt in enumerate(image_prompts))
+
+                    prompts.grid_prompt = "".join(parts)
             # ---------------------------
 
             self.finished.emit(prompts)
@@ -688,24 +769,5 @@ class PromptGenerationThread(QThread):
 
     def _calculate_grid_layout(self, count: int) -> tuple:
         """计算网格布局 (n, m)"""
-        if count <= 0:
-            return 1, 1
-        
-        # 特殊规则
-        if count == 3:
-            return 1, 3  # 1x3 长条
-        if count == 5:
-            return 1, 5  # 1x5 长条
-        
-        # 默认尝试接近正方形的布局 (2x2, 2x3, 3x3)
-        import math
-        n = int(math.ceil(math.sqrt(count)))
-        m = int(math.ceil(count / n))
-        
-        return m, n # 行, 列 (m*n) 或者 n*m，根据用户习惯通常是 行x列 或者 列x行。
-                    # 用户描述: "1*3" usually means 1 row 3 cols or 1 col 3 rows?
-                    # let's assume Row x Col. 
-                    # Users said: "3 or 5 can be 1*3". This likely means 1 Row, 3 Cols (Horizontal Strip).
-                    # I will return (1, count) for 3 and 5.
-
-
+        layout = _GRID_LAYOUT.get(count)
+        return layout if layout else _grid_layout(count)
@@ -2,18 +2,160 @@
 提示词编辑页面
 表格形式编辑、查看、修改图像提示词
 """
-from typing import Optional
+from pathlib import Path
+from typing import Optional, List, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableView, QHeaderView,
     QPushButton, QLabel, QGroupBox, QMenu,
     QMessageBox, QAbstractItemView, QTextEdit,
-    QFormLayout, QTabWidget
+    QFormLayout, QTabWidget, QApplication,
+    QInputDialog, QComboBox, QDialog, QListWidget,
+    QFileDialog, QLineEdit, QDialogButtonBox
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QTimer, QSignalBlocker, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QAction
 
-from schemas.poetry import PoetryPromptsResponse, VersePrompts, ImagePrompt
+from schemas.poetry import PoetryPromptsResponse, VersePrompts, ImagePrompt, MusicPrompt
+
+
+# 单元格标志（按列共享，避免每次查询重新组合）
+_BASE_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+_EDITABLE_FLAGS = _BASE_FLAGS | Qt.ItemIsEditable
+
+
+class PromptsTableModel(QAbstractTableModel):
+    """
+    提示词表格模型
+
+    直接读取 PoetryPromptsResponse 中的数据，每行对应一个 (诗句, 提示词序号)。
+    行索引仅在结构变化（设置/添加/删除）时重建。
+    """
+
+    HEADERS = ["诗句", "序号", "图像提示词", "视频提示词", "长度"]
+    COL_VERSE, COL_INDEX, COL_PROMPT, COL_VIDEO, COL_LENGTH = range(5)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._prompts: Optional[PoetryPromptsResponse] = None
+        self._rows: List[Tuple[VersePrompts, int]] = []
+
+    # ---------- 结构 ----------
+
+    def set_prompts(self, prompts: Optional[PoetryPromptsResponse]) -> None:
+        """设置数据源并重建行索引"""
+        self.beginResetModel()
+        self._prompts = prompts
+        self._rebuild_rows()
+        self.endResetModel()
+
+    def _rebuild_rows(self) -> None:
+        """重建 行 -> (诗句, 提示词序号) 索引"""
+        if self._prompts is None:
+            self._rows = []
+            return
+        self._rows = [
+            (verse, i)
+            for verse in self._prompts.prompts
+            for i in range(len(verse.descriptions))
+        ]
+
+    def prompt_at(self, row: int) -> Tuple[VersePrompts, int]:
+        """获取指定行对应的 (诗句, 提示词序号)"""
+        return self._rows[row]
+
+    def append_description(self, verse: VersePrompts, description: str) -> None:
+        """为诗句追加提示词，只插入新行"""
+        row = 0
+        for v in self._prompts.prompts:
+            row += len(v.descriptions)
+            if v is verse:
+                break
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        verse.add_description(description)
+        self._rows.insert(row, (verse, len(verse.descriptions) - 1))
+        self.endInsertRows()
+
+    def remove_rows(self, rows) -> None:
+        """删除指定行的提示词（按诗句分组批量删除，只重置一次模型）"""
+        by_verse = {}
+        for row in rows:
+            verse, prompt_index = self._rows[row]
+            by_verse.setdefault(id(verse), (verse, set()))[1].add(prompt_index)
+
+        self.beginResetModel()
+        for verse, indices in by_verse.values():
+            verse.remove_descriptions(indices)
+        self._rebuild_rows()
+        self.endResetModel()
+
+    # ---------- QAbstractTableModel 接口 ----------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            verse, prompt_index = self._rows[index.row()]
+            desc = verse.descriptions[prompt_index]
+            if column == self.COL_VERSE:
+                return verse.verse
+            if column == self.COL_INDEX:
+                return prompt_index + 1
+            if column == self.COL_PROMPT:
+                return desc.description
+            if column == self.COL_VIDEO:
+                return getattr(desc, 'video_prompt', '') or ''
+            if column == self.COL_LENGTH:
+                return len(desc.description)
+
+        if role == Qt.TextAlignmentRole and column in (self.COL_INDEX, self.COL_LENGTH):
+            return Qt.AlignCenter
+
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() in (self.COL_PROMPT, self.COL_VIDEO):
+            return _EDITABLE_FLAGS
+        return _BASE_FLAGS
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+
+        column = index.column()
+        if column not in (self.COL_PROMPT, self.COL_VIDEO):
+            return False
+
+        verse, prompt_index = self._rows[index.row()]
+        desc = verse.descriptions[prompt_index]
+
+        if column == self.COL_PROMPT:
+            desc.description = value
+            # 长度列随图像提示词变化
+            last = index.siblingAtColumn(self.COL_LENGTH)
+        else:
+            desc.video_prompt = value
+            last = index
+
+        self.dataChanged.emit(index, last)
+        return True
 
 
 class PromptEditorPage(QWidget):
@@ -34,6 +176,16 @@ class PromptEditorPage(QWidget):
         super().__init__(parent)
 
         self.prompts: Optional[PoetryPromptsResponse] = None
+        self._dirty = False  # 页面隐藏期间数据变化，待显示时刷新表格
+        self._music_cache: Optional[tuple] = None  # 已显示的音乐字段 (标题, 风格, 中文歌词, 英文歌词)
+        self._add_dialog: Optional[QDialog] = None  # 添加提示词对话框（延迟创建）
+        self._dump_cache: Optional[bytes] = None  # 导出 JSON 缓存，数据修改时失效
+
+        # 合并短时间内的多次变更，只发出一次 prompts_changed
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(100)
+        self._emit_timer.timeout.connect(self._emit_prompts_changed)
 
         self._init_ui()
 
@@ -69,16 +221,17 @@ class PromptEditorPage(QWidget):
 
         layout.addLayout(header_layout)
 
-        # 创建表格
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["诗句", "序号", "图像提示词", "视频提示词", "长度"])
+        # 创建表格（模型/视图）
+        self._model = PromptsTableModel(self)
+        self._model.dataChanged.connect(self._mark_changed)  # 对话框和单元格内编辑
+        self.table = QTableView()
+        self.table.setModel(self._model)
 
         # 设置表格属性
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setAlternatingRowColors(True)
-        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.horizontalHeader().setStretchLastSection(False)  # 第2/3列已拉伸填充
 
         # 列宽设置
         header = self.table.horizontalHeader()
@@ -86,17 +239,38 @@ class PromptEditorPage(QWidget):
         header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.Stretch)
         header.setSectionResizeMode(3, QHeaderView.Stretch)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
+        # 长度列固定宽度，编辑提示词时不触发整列内容宽度重算
+        header.setSectionResizeMode(4, QHeaderView.Fixed)
+        self.table.setColumnWidth(4, 60)
+
+        # 统一固定行高，绘制和滚动时不再逐行测量内容高度
+        v_header = self.table.verticalHeader()
+        v_header.setSectionResizeMode(QHeaderView.Fixed)
+        v_header.setDefaultSectionSize(self.fontMetrics().height() + 8)
+
+        # 支持右键菜单（菜单和动作只创建一次）
+        self._context_menu = QMenu(self)
+
+        edit_action = QAction("编辑", self)
+        edit_action.triggered.connect(self._edit_selected)
+        self._context_menu.addAction(edit_action)
+
+        delete_action = QAction("删除", self)
+        delete_action.triggered.connect(self._delete_selected)
+        self._context_menu.addAction(delete_action)
+
+        copy_action = QAction("复制提示词", self)
+        copy_action.triggered.connect(self._copy_prompt)
+        self._context_menu.addAction(copy_action)
 
-        # 支持右键菜单
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._show_context_menu)
 
         # 双击编辑
-        self.table.itemDoubleClicked.connect(self._edit_item)
+        self.table.doubleClicked.connect(self._edit_item)
 
         # 选中变化
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
         layout.addWidget(self.table)
         
@@ -183,46 +357,45 @@ class PromptEditorPage(QWidget):
         layout.addWidget(self.music_group)
 
         # 底部统计信息
-        self.stats_label = QLabel("无数据")
+        self._stats_text = "无数据"
+        self.stats_label = QLabel(self._stats_text)
         self.stats_label.setStyleSheet("color: #666;")
         layout.addWidget(self.stats_label)
 
+    def _mark_changed(self, *_):
+        """数据已修改：使导出缓存失效，并（合并后）发出变更信号"""
+        self._dump_cache = None
+        self._emit_timer.start()
+
+    def _emit_prompts_changed(self):
+        """发出提示词变更信号"""
+        self.prompts_changed.emit(self.prompts)
+
     def _show_context_menu(self, pos):
         """显示右键菜单"""
         if self.prompts is None:
             return
 
-        menu = QMenu(self)
-
-        edit_action = QAction("编辑", self)
-        edit_action.triggered.connect(self._edit_selected)
-        menu.addAction(edit_action)
-
-        delete_action = QAction("删除", self)
-        delete_action.triggered.connect(self._delete_selected)
-        menu.addAction(delete_action)
-
-        copy_action = QAction("复制提示词", self)
-        copy_action.triggered.connect(self._copy_prompt)
-        menu.addAction(copy_action)
-
-        menu.exec_(self.table.mapToGlobal(pos))
+        self._context_menu.exec_(self.table.mapToGlobal(pos))
 
     def _on_selection_changed(self):
         """选中项变化"""
-        has_selection = len(self.table.selectedItems()) > 0
+        has_selection = self.table.selectionModel().hasSelection()
         self.delete_btn.setEnabled(has_selection and self.prompts is not None)
 
-    def _edit_item(self, item: QTableWidgetItem):
+    def _selected_row(self) -> int:
+        """获取当前选中行，无选中时返回 -1"""
+        rows = self.table.selectionModel().selectedRows()
+        return rows[0].row() if rows else -1
+
+    def _edit_item(self, index: QModelIndex):
         """编辑项目"""
-        column = item.column()
+        column = index.column()
         # 只允许编辑第2列（图像提示词）和第3列（视频提示词）
-        if column not in (2, 3):
+        if column not in (PromptsTableModel.COL_PROMPT, PromptsTableModel.COL_VIDEO):
             return
 
-        from PySide6.QtWidgets import QInputDialog
-
-        current_text = item.text()
+        current_text = index.data()
         title = "编辑图像提示词" if column == 2 else "编辑视频提示词"
         label = "图像提示词:" if column == 2 else "视频提示词:"
         
@@ -234,37 +407,17 @@ class PromptEditorPage(QWidget):
         )
 
         if ok:
-            # 更新数据
-            row = item.row()
-            verse_index = self.table.item(row, 0).data(Qt.UserRole)
-            prompt_index = self.table.item(row, 1).data(Qt.UserRole)
-
-            verse = self.prompts.get_verse(verse_index)
-            if verse and 0 <= prompt_index < len(verse.descriptions):
-                if column == 2:
-                    verse.descriptions[prompt_index].description = new_text
-                else:
-                    verse.descriptions[prompt_index].video_prompt = new_text
-
-                # 更新显示
-                item.setText(new_text)
-                if column == 2:
-                    length_item = self.table.item(row, 4)
-                    length_item.setText(str(len(new_text)))
-
-                self.prompts_changed.emit(self.prompts)
+            # 更新数据（模型只刷新该单元格及长度列）
+            self._model.setData(index, new_text)
 
     def _edit_selected(self):
         """编辑选中项"""
-        selected = self.table.selectedItems()
-        if not selected:
+        row = self._selected_row()
+        if row < 0:
             return
 
-        # 找到提示词列的项目
-        for item in selected:
-            if item.column() == 2:
-                self._edit_item(item)
-                break
+        # 编辑提示词列
+        self._edit_item(self._model.index(row, PromptsTableModel.COL_PROMPT))
 
     def _add_prompt(self):
         """添加新提示词"""
@@ -272,60 +425,68 @@ class PromptEditorPage(QWidget):
             QMessageBox.warning(self, "添加失败", "请先生成提示词")
             return
 
-        from PySide6.QtWidgets import QInputDialog, QComboBox
-
-        # 选择诗句
-        dialog = QInputDialog(self)
-        dialog.setWindowTitle("选择诗句")
-        dialog.setLabelText("为哪句诗添加提示词？")
-
-        combo = QComboBox()
-        for verse in self.prompts.prompts:
-            combo.addItem(f"{verse.verse}", verse.index)
-
-        dialog.setComboBox(combo)
+        # 诗句选择和提示词输入合并在同一个对话框中
+        dialog = self._get_add_dialog()
+        self._add_verse_combo.clear()
+        self._add_verse_combo.addItems([verse.verse for verse in self.prompts.prompts])
+        self._add_prompt_edit.clear()
+        self._add_ok_btn.setEnabled(False)
 
         if dialog.exec():
-            verse_index = combo.currentData()
-
-            # 输入提示词
-            new_prompt, ok = QInputDialog.getText(
-                self,
-                "新提示词",
-                "请输入新的图像提示词 (英文):",
-                minimum=20
+            # 下拉项与 prompts 顺序一致，直接按位置取诗句
+            verse = self.prompts.prompts[self._add_verse_combo.currentIndex()]
+            new_prompt = self._add_prompt_edit.text().strip()
+
+            self._model.append_description(verse, new_prompt)
+            self._update_stats()
+            self._mark_changed()
+
+    def _get_add_dialog(self) -> QDialog:
+        """获取添加提示词对话框（首次使用时创建，之后复用）"""
+        if self._add_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("添加提示词")
+            dialog.setMinimumWidth(500)
+            form = QFormLayout(dialog)
+
+            self._add_verse_combo = QComboBox()
+            form.addRow("诗句:", self._add_verse_combo)
+
+            self._add_prompt_edit = QLineEdit()
+            self._add_prompt_edit.setPlaceholderText("请输入新的图像提示词 (英文，至少 20 个字符)")
+            form.addRow("提示词:", self._add_prompt_edit)
+
+            buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+            buttons.accepted.connect(dialog.accept)
+            buttons.rejected.connect(dialog.reject)
+            form.addRow(buttons)
+
+            # 提示词不足 20 个字符时禁止确认（与 ImagePrompt 校验一致）
+            self._add_ok_btn = buttons.button(QDialogButtonBox.Ok)
+            self._add_prompt_edit.textChanged.connect(
+                lambda text: self._add_ok_btn.setEnabled(len(text.strip()) >= 20)
             )
 
-            if ok and new_prompt:
-                verse = self.prompts.get_verse(verse_index)
-                if verse:
-                    verse.add_description(new_prompt)
-                    self._refresh_table()
-                    self.prompts_changed.emit(self.prompts)
+            self._add_dialog = dialog
+        return self._add_dialog
 
     def _delete_selected(self):
         """删除选中的提示词"""
-        selected = self.table.selectedItems()
-        if not selected:
+        rows_to_delete = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        if not rows_to_delete:
             return
 
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QListWidget, QPushButton
-
         # 创建选择对话框
         dialog = QDialog(self)
         dialog.setWindowTitle("确认删除")
         layout = QVBoxLayout(dialog)
 
         list_widget = QListWidget()
-        rows_to_delete = set()
 
-        for item in selected:
-            row = item.row()
-            if row not in rows_to_delete:
-                verse_item = self.table.item(row, 0)
-                prompt_item = self.table.item(row, 2)
-                list_widget.addItem(f"{verse_item.text()} - {prompt_item.text()[:50]}...")
-                rows_to_delete.add(row)
+        for row in rows_to_delete:
+            verse, prompt_index = self._model.prompt_at(row)
+            description = verse.descriptions[prompt_index].description
+            list_widget.addItem(f"{verse.verse} - {description[:50]}...")
 
         layout.addWidget(list_widget)
 
@@ -341,39 +502,43 @@ class PromptEditorPage(QWidget):
         layout.addLayout(btn_layout)
 
         if dialog.exec():
-            # 执行删除
-            for row in sorted(rows_to_delete, reverse=True):
-                verse_index = self.table.item(row, 0).data(Qt.UserRole)
-                prompt_index = self.table.item(row, 1).data(Qt.UserRole)
-
-                verse = self.prompts.get_verse(verse_index)
-                if verse:
-                    verse.remove_description(prompt_index)
-
-            self._refresh_table()
-            self.prompts_changed.emit(self.prompts)
+            # 执行删除（批量移除期间屏蔽选中变化信号）
+            with QSignalBlocker(self.table.selectionModel()):
+                self._model.remove_rows(rows_to_delete)
+            self._update_stats()
+            self._mark_changed()
 
     def _copy_prompt(self):
         """复制提示词"""
-        selected = self.table.selectedItems()
-        if not selected:
+        row = self._selected_row()
+        if row < 0:
             return
 
-        for item in selected:
-            if item.column() == 2:
-                from PySide6.QtWidgets import QApplication
-                QApplication.clipboard().setText(item.text())
-                QMessageBox.information(self, "复制成功", "提示词已复制到剪贴板")
-                break
+        index = self._model.index(row, PromptsTableModel.COL_PROMPT)
+        QApplication.clipboard().setText(index.data())
+        self._show_copied("提示词已复制到剪贴板")
+
+    def _show_copied(self, message: str):
+        """在统计栏短暂提示复制结果（不弹出模态对话框）"""
+        self.stats_label.setText(f"✓ {message}")
+        QTimer.singleShot(1500, self._restore_stats_text)
+
+    def _restore_stats_text(self):
+        """恢复统计信息文本"""
+        self.stats_label.setText(self._stats_text)
+
+    def _dump(self) -> bytes:
+        """序列化提示词数据（未修改时复用上次结果）"""
+        if self._dump_cache is None:
+            # pydantic 原生序列化，非 ASCII 字符直接输出为 UTF-8
+            self._dump_cache = self.prompts.model_dump_json(indent=2).encode('utf-8')
+        return self._dump_cache
 
     def _export_json(self):
         """导出为 JSON"""
         if self.prompts is None:
             return
 
-        from PySide6.QtWidgets import QFileDialog
-        import json
-
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "导出提示词",
@@ -383,68 +548,52 @@ class PromptEditorPage(QWidget):
 
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.prompts.model_dump(), f, indent=2, ensure_ascii=False)
+                Path(file_path).write_bytes(self._dump())
                 QMessageBox.information(self, "导出成功", f"提示词已导出到 {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "导出失败", f"导出失败: {str(e)}")
 
+    def showEvent(self, event):
+        """页面显示时刷新延迟的表格内容"""
+        super().showEvent(event)
+        if self._dirty:
+            self._refresh_table()
+
     def _refresh_table(self):
         """刷新表格内容"""
-        self.table.setRowCount(0)
+        self._dirty = False
+
+        # 重置期间屏蔽选中变化信号，结束后统一同步一次按钮状态
+        with QSignalBlocker(self.table.selectionModel()):
+            self._model.set_prompts(self.prompts)
+        self._update_stats()
+
+    def _update_stats(self):
+        """更新统计信息和按钮状态"""
+        self._on_selection_changed()
 
         if self.prompts is None:
             return
 
-        row = 0
-        for verse in self.prompts.prompts:
-            for i, desc in enumerate(verse.descriptions):
-                self.table.insertRow(row)
-
-                # 诗句
-                verse_item = QTableWidgetItem(verse.verse)
-                verse_item.setData(Qt.UserRole, verse.index)
-                self.table.setItem(row, 0, verse_item)
-
-                # 序号
-                index_item = QTableWidgetItem(str(i + 1))
-                index_item.setData(Qt.UserRole, i)
-                index_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, 1, index_item)
-
-                # 图像提示词
-                prompt_item = QTableWidgetItem(desc.description)
-                prompt_item.setFlags(prompt_item.flags() | Qt.ItemIsEditable)
-                self.table.setItem(row, 2, prompt_item)
-
-                # 视频提示词
-                video_prompt = getattr(desc, 'video_prompt', '') or ''
-                video_item = QTableWidgetItem(video_prompt)
-                video_item.setFlags(video_item.flags() | Qt.ItemIsEditable)
-                self.table.setItem(row, 3, video_item)
-
-                # 长度
-                length_item = QTableWidgetItem(str(len(desc.description)))
-                length_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, 4, length_item)
-
-                row += 1
-
         # 更新统计
         total = self.prompts.total_prompts()
         verses_count = len(self.prompts.prompts)
-        self.stats_label.setText(f"共 {verses_count} 句诗，{total} 个提示词")
+        self._stats_text = f"共 {verses_count} 句诗，{total} 个提示词"
+        self.stats_label.setText(self._stats_text)
 
         # 启用/禁用按钮
         has_data = self.prompts is not None and total > 0
         self.add_btn.setEnabled(has_data)
-        self.delete_btn.setEnabled(False)
         self.export_btn.setEnabled(has_data)
 
     def set_prompts(self, prompts: PoetryPromptsResponse):
         """设置提示词数据"""
         self.prompts = prompts
-        self._refresh_table()
+        self._dump_cache = None
+        # 页面不可见时延迟到 showEvent 再刷新表格
+        self._dirty = True
+        if self.isVisible():
+            self._refresh_table()
         self._update_music_display()
         self._update_grid_display()
 
@@ -461,32 +610,48 @@ class PromptEditorPage(QWidget):
         """九宫格提示词变更"""
         if self.prompts:
             self.prompts.grid_prompt = self.grid_prompt_edit.toPlainText()
-            self.prompts_changed.emit(self.prompts)
+            self._mark_changed()
 
     def _copy_grid_prompt(self):
         """复制九宫格提示词"""
         text = self.grid_prompt_edit.toPlainText()
         if text:
-            from PySide6.QtWidgets import QApplication
             QApplication.clipboard().setText(text)
-            QMessageBox.information(self, "复制成功", "九宫格提示词已复制到剪贴板")
+            self._show_copied("九宫格提示词已复制到剪贴板")
 
     def _update_music_display(self):
         """更新音乐提示词显示"""
         if self.prompts and self.prompts.music_prompt:
             music = self.prompts.music_prompt
-            self.music_title_label.setText(music.title or "无标题")
-            self.music_style_label.setText(music.style_prompt or "未设置")
-            self.lyrics_cn_edit.setPlainText(music.lyrics_cn or "")
-            self.lyrics_en_edit.setPlainText(music.lyrics_en or "")
+            values = (
+                music.title or "无标题",
+                music.style_prompt or "未设置",
+                music.lyrics_cn or "",
+                music.lyrics_en or "",
+            )
+            # 只更新发生变化的字段，避免重建未变的歌词文档
+            cached = self._music_cache or (None, None, None, None)
+            if values[0] != cached[0]:
+                self.music_title_label.setText(values[0])
+            if values[1] != cached[1]:
+                self.music_style_label.setText(values[1])
+            if values[2] != cached[2]:
+                with QSignalBlocker(self.lyrics_cn_edit):
+                    self.lyrics_cn_edit.setPlainText(values[2])
+            if values[3] != cached[3]:
+                with QSignalBlocker(self.lyrics_en_edit):
+                    self.lyrics_en_edit.setPlainText(values[3])
+            self._music_cache = values
             self.copy_music_btn.setEnabled(True)
             self.edit_music_btn.setEnabled(True)
             self.send_music_btn.setEnabled(True)
         else:
+            self._music_cache = None
             self.music_title_label.setText("（生成后显示）")
             self.music_style_label.setText("（生成后显示）")
-            self.lyrics_cn_edit.clear()
-            self.lyrics_en_edit.clear()
+            with QSignalBlocker(self.lyrics_cn_edit), QSignalBlocker(self.lyrics_en_edit):
+                self.lyrics_cn_edit.clear()
+                self.lyrics_en_edit.clear()
             self.copy_music_btn.setEnabled(False)
             self.edit_music_btn.setEnabled(False)
             self.send_music_btn.setEnabled(False)
@@ -501,7 +666,6 @@ class PromptEditorPage(QWidget):
         if not self.prompts or not self.prompts.music_prompt:
             return
         
-        from PySide6.QtWidgets import QApplication
         music = self.prompts.music_prompt
         
         text = f"""=== Suno AI Music Prompt ===
@@ -515,15 +679,13 @@ Style: {music.style_prompt}
 {music.lyrics_en}
 """
         QApplication.clipboard().setText(text)
-        QMessageBox.information(self, "复制成功", "音乐提示词已复制到剪贴板")
+        self._show_copied("音乐提示词已复制到剪贴板")
 
     def _edit_music_prompt(self):
         """编辑音乐提示词"""
         if not self.prompts:
             return
-        
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QLineEdit, QTextEdit, QDialogButtonBox
-        
+
         dialog = QDialog(self)
         dialog.setWindowTitle("编辑音乐提示词")
         dialog.setMinimumSize(600, 500)
@@ -563,7 +725,6 @@ Style: {music.style_prompt}
         layout.addWidget(buttons)
         
         if dialog.exec() == QDialog.Accepted:
-            from schemas.poetry import MusicPrompt
             self.prompts.music_prompt = MusicPrompt(
                 title=title_edit.text(),
                 style_prompt=style_edit.text(),
@@ -572,7 +733,7 @@ Style: {music.style_prompt}
                 instrumental=False
             )
             self._update_music_display()
-            self.prompts_changed.emit(self.prompts)
+            self._mark_changed()
 
     def get_prompts(self) -> Optional[PoetryPromptsResponse]:
         """获取当前提示词数据"""
@@ -2,17 +2,154 @@
 设置面板
 API 配置、模型选择等设置界面
 """
+import json
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
     QGroupBox, QLineEdit, QComboBox, QSpinBox,
     QDoubleSpinBox, QCheckBox, QPushButton, QLabel,
     QTabWidget, QScrollArea, QMessageBox
 )
-from PySide6.QtCore import Signal, Qt, QThread
+from PySide6.QtCore import Signal, Qt, QThread, QSignalBlocker
+from PySide6.QtGui import QStandardItemModel, QStandardItem
 from pathlib import Path
 
 from core.app import get_app_state
-from config.api_config import Models
+from config.api_config import APIConfig, Models
+
+
+# orjson 为可选依赖，未安装时退回标准库
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# 连接测试共用的 HTTP 会话，多次点击“测试连接”时复用 TCP/TLS 连接
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """获取（首次调用时创建）连接测试用的 requests.Session"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def _fill_combo(combo: QComboBox, pairs):
+    """一次性构建选项模型再整体设置给下拉框，避免逐个 addItem 触发的信号和重排"""
+    model = QStandardItemModel(combo)
+    for data, name in pairs:
+        item = QStandardItem(name)
+        item.setData(data, Qt.UserRole)
+        model.appendRow(item)
+    with QSignalBlocker(combo):
+        combo.setModel(model)
+
+
+class LazyComboBox(QComboBox):
+    """首次展开下拉列表时才填充选项的下拉框
+
+    loader 返回 (data, text) 序列；填充前通过 set_current_value 设置的值
+    只显示在编辑框中，填充完成后再选中对应项。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._loader = None
+        self._names = {}
+        self._pending_value = None
+        self._pending_text = None
+
+    def set_loader(self, loader, names: dict = None):
+        """设置选项加载函数（在首次展开或读取时调用一次）
+
+        names 为 data -> 显示文本，用于填充前在编辑框中显示当前值。
+        """
+        self._loader = loader
+        self._names = names or {}
+
+    def ensure_populated(self):
+        """确保选项已填充"""
+        if self._loader is None:
+            return
+        loader, self._loader = self._loader, None
+
+        # 用户已手动修改过编辑框时，以输入内容为准
+        text = self.currentText()
+        value = self._pending_value if text == self._pending_text else text
+        self._pending_value = self._pending_text = None
+
+        _fill_combo(self, loader())
+        if value:
+            self.set_current_value(value)
+
+    def set_current_value(self, value: str, text: str = None):
+        """按 itemData 或显示文本选中项，找不到时直接填入编辑框"""
+        if self._loader is not None:
+            self._pending_value = value
+            self._pending_text = text or self._names.get(value, value)
+            self.setCurrentText(self._pending_text)
+            return
+
+        index = self.findData(value)
+        if index < 0:
+            index = self.findText(value)
+        if index >= 0:
+            self.setCurrentIndex(index)
+        else:
+            self.setCurrentText(value)
+
+    def current_value(self) -> str:
+        """当前选中项的 data，自定义输入时返回文本"""
+        self.ensure_populated()
+        return self.currentData() or self.currentText()
+
+    def showPopup(self):
+        self.ensure_populated()
+        super().showPopup()
+
+
+def _widget_value(widget):
+    """读取输入控件的当前值"""
+    if isinstance(widget, LazyComboBox):
+        return widget.current_value()
+    if isinstance(widget, QComboBox):
+        return widget.currentData()
+    if isinstance(widget, QLineEdit):
+        return widget.text()
+    if isinstance(widget, QCheckBox):
+        return widget.isChecked()
+    return widget.value()
+
+
+def _set_widget_value(widget, value):
+    """设置输入控件的值"""
+    if isinstance(widget, LazyComboBox):
+        widget.set_current_value(value)
+    elif isinstance(widget, QComboBox):
+        index = widget.findData(value)
+        if index >= 0:
+            widget.setCurrentIndex(index)
+    elif isinstance(widget, QLineEdit):
+        widget.setText(value)
+    elif isinstance(widget, QCheckBox):
+        widget.setChecked(value)
+    else:
+        widget.setValue(value)
 
 
 class SettingsPanel(QWidget):
@@ -20,11 +157,48 @@ class SettingsPanel(QWidget):
 
     settings_changed = Signal()
 
+    # 连接状态样式表（预先拼好，避免每次更新状态时重新格式化）
+    _STATUS_STYLE_TEMPLATE = "color: {}; padding: 5px; background-color: #f5f5f5; border-radius: 4px;"
+    _STATUS_STYLES = {
+        "testing": _STATUS_STYLE_TEMPLATE.format("#FF9800"),   # 橙色
+        "success": _STATUS_STYLE_TEMPLATE.format("#4CAF50"),   # 绿色
+        "error": _STATUS_STYLE_TEMPLATE.format("#F44336"),     # 红色
+    }
+    _DEFAULT_STATUS_STYLE = _STATUS_STYLE_TEMPLATE.format("#999")
+
+    # 配置项与输入控件的对应关系：(配置键, 控件属性名)
+    _FIELDS = (
+        ('api_key', 'api_key_edit'),
+        ('base_url', 'base_url_edit'),
+        ('timeout', 'timeout_spin'),
+        ('max_retries', 'max_retries_spin'),
+        ('use_native_google', 'native_google_check'),
+        ('model', 'text_model_combo'),
+        ('image_model', 'image_model_combo'),
+        ('temperature', 'temperature_spin'),
+        ('top_p', 'top_p_spin'),
+        ('video_model', 'video_model_combo'),
+        ('video_aspect_ratio', 'aspect_ratio_combo'),
+        ('video_size', 'size_combo'),
+        ('music_model', 'music_model_combo'),
+        ('music_tags', 'music_tags_edit'),
+        ('example_count', 'example_count_spin'),
+        ('style_anchors', 'style_anchors_check'),
+    )
+
+    # “重置为默认”不改动的配置项（模型选择保持当前值）
+    _RESET_SKIP = frozenset((
+        'model', 'image_model', 'video_model',
+        'video_aspect_ratio', 'video_size', 'music_model',
+    ))
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.app_state = get_app_state()
         self.config = self.app_state.config
+        self._test_thread = None
+        self._save_thread = None
 
         self._init_ui()
         self._load_config()
@@ -41,7 +215,9 @@ class SettingsPanel(QWidget):
 
         # 创建内容部件
         content = QWidget()
+        content.setUpdatesEnabled(False)  # 全部分组构建完成前不重绘
         content_layout = QVBoxLayout(content)
+        content_layout.setEnabled(False)
 
         # API 配置组
         api_group = self._create_api_group()
@@ -73,13 +249,15 @@ class SettingsPanel(QWidget):
         reset_btn.clicked.connect(self._reset_to_default)
         button_layout.addWidget(reset_btn)
 
-        save_btn = QPushButton("保存配置")
-        save_btn.clicked.connect(self._save_config)
-        button_layout.addWidget(save_btn)
+        self.save_btn = QPushButton("保存配置")
+        self.save_btn.clicked.connect(self._save_config)
+        button_layout.addWidget(self.save_btn)
 
         content_layout.addLayout(button_layout)
 
+        content_layout.setEnabled(True)
         scroll.setWidget(content)
+        content.setUpdatesEnabled(True)
         layout.addWidget(scroll)
 
     def _create_api_group(self) -> QGroupBox:
@@ -138,7 +316,7 @@ class SettingsPanel(QWidget):
         group.setLayout(layout)
         return group
 
-    def _create_combo_row(self, combo: QComboBox, model_type: str) -> QHBoxLayout:
+    def _create_combo_row(self, combo: LazyComboBox, model_type: str) -> QHBoxLayout:
         """创建带有保存按钮的下拉框行"""
         row = QHBoxLayout()
         combo.setEditable(True)
@@ -153,16 +331,17 @@ class SettingsPanel(QWidget):
         
         return row
 
-    def _save_custom_model(self, combo: QComboBox, model_type: str):
+    def _save_custom_model(self, combo: LazyComboBox, model_type: str):
         """保存自定义模型"""
         model_name = combo.currentText().strip()
         if not model_name:
             return
+
+        combo.ensure_populated()
             
         # 检查是否已存在
-        for i in range(combo.count()):
-            if combo.itemText(i) == model_name:
-                return
+        if combo.findText(model_name) >= 0:
+            return
 
         # 添加到配置
         if model_type not in self.config.custom_models:
@@ -176,7 +355,6 @@ class SettingsPanel(QWidget):
             combo.addItem(model_name, model_name)
             combo.setCurrentIndex(combo.count() - 1)
             
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(self, "成功", f"模 '{model_name}' 已保存到自定义列表")
 
     def _create_model_group(self) -> QGroupBox:
@@ -185,15 +363,17 @@ class SettingsPanel(QWidget):
         layout = QFormLayout()
 
         # 文本模型
-        self.text_model_combo = QComboBox()
-        for model_id, name in Models.TEXT_MODELS.items():
-            self.text_model_combo.addItem(name, model_id)
+        self.text_model_combo = LazyComboBox()
+        self.text_model_combo.set_loader(
+            lambda: self._model_items(Models.TEXT_MODELS, 'text'), Models.TEXT_MODELS
+        )
         layout.addRow("文本模型:", self._create_combo_row(self.text_model_combo, 'text'))
 
         # 图像模型
-        self.image_model_combo = QComboBox()
-        for model_id, name in Models.IMAGE_MODELS.items():
-            self.image_model_combo.addItem(name, model_id)
+        self.image_model_combo = LazyComboBox()
+        self.image_model_combo.set_loader(
+            lambda: self._model_items(Models.IMAGE_MODELS, 'image'), Models.IMAGE_MODELS
+        )
         layout.addRow("图像模型:", self._create_combo_row(self.image_model_combo, 'image'))
 
         # 温度参数
@@ -219,21 +399,20 @@ class SettingsPanel(QWidget):
         layout = QFormLayout()
 
         # 视频模型
-        self.video_model_combo = QComboBox()
-        for model_id, name in Models.VIDEO_MODELS.items():
-            self.video_model_combo.addItem(name, model_id)
+        self.video_model_combo = LazyComboBox()
+        self.video_model_combo.set_loader(
+            lambda: self._model_items(Models.VIDEO_MODELS, 'video'), Models.VIDEO_MODELS
+        )
         layout.addRow("视频模型:", self._create_combo_row(self.video_model_combo, 'video'))
 
         # 宽高比
         self.aspect_ratio_combo = QComboBox()
-        for ratio, name in Models.ASPECT_RATIOS.items():
-            self.aspect_ratio_combo.addItem(name, ratio)
+        _fill_combo(self.aspect_ratio_combo, Models.ASPECT_RATIOS.items())
         layout.addRow("宽高比:", self.aspect_ratio_combo)
 
         # 分辨率
         self.size_combo = QComboBox()
-        self.size_combo.addItem("720P", "720P")
-        self.size_combo.addItem("1080P", "1080P")
+        _fill_combo(self.size_combo, (("720P", "720P"), ("1080P", "1080P")))
         layout.addRow("分辨率:", self.size_combo)
 
         group.setLayout(layout)
@@ -245,9 +424,10 @@ class SettingsPanel(QWidget):
         layout = QFormLayout()
 
         # 音乐模型
-        self.music_model_combo = QComboBox()
-        for model_id, name in Models.MUSIC_MODELS.items():
-            self.music_model_combo.addItem(name, model_id)
+        self.music_model_combo = LazyComboBox()
+        self.music_model_combo.set_loader(
+            lambda: self._model_items(Models.MUSIC_MODELS, 'music'), Models.MUSIC_MODELS
+        )
         layout.addRow("音乐模型:", self._create_combo_row(self.music_model_combo, 'music'))
 
         # 风格标签
@@ -277,132 +457,72 @@ class SettingsPanel(QWidget):
         group.setLayout(layout)
         return group
 
-    def _load_custom_models(self, combo: QComboBox, model_type: str):
-        """加载自定义模型到下拉框"""
-        if not hasattr(self.config, 'custom_models'):
-            return
-            
-        custom_models = self.config.custom_models.get(model_type, [])
-        for model_name in custom_models:
-            # 检查是否已存在
-            exists = False
-            for i in range(combo.count()):
-                if combo.itemText(i) == model_name:
-                    exists = True
-                    break
-            
-            if not exists:
-                combo.addItem(model_name, model_name)
+    def _model_items(self, models: dict, model_type: str) -> list:
+        """内置模型加上自定义模型（按名称去重），供下拉框首次展开时填充"""
+        items = list(models.items())
+        names = set(models.values())
+        for model_name in getattr(self.config, 'custom_models', {}).get(model_type, []):
+            if model_name not in names:
+                names.add(model_name)
+                items.append((model_name, model_name))
+        return items
+
+    def _apply_values(self, values: dict):
+        """批量写入控件值（写入期间屏蔽控件信号）"""
+        for key, attr in self._FIELDS:
+            if key not in values:
+                continue
+            widget = getattr(self, attr)
+            with QSignalBlocker(widget):
+                _set_widget_value(widget, values[key])
 
     def _load_config(self):
         """加载配置"""
         config = self.config
-
-        # API 配置
-        self.api_key_edit.setText(config.api_key)
-        self.base_url_edit.setText(config.base_url)
-        self.timeout_spin.setValue(config.timeout)
-        self.max_retries_spin.setValue(config.max_retries)
-        self.native_google_check.setChecked(config.use_native_google)
-
-        # 加载自定义模型
-        self._load_custom_models(self.text_model_combo, 'text')
-        self._load_custom_models(self.image_model_combo, 'image')
-        self._load_custom_models(self.video_model_combo, 'video')
-        self._load_custom_models(self.music_model_combo, 'music')
-
-        # 文本模型
-        for i in range(self.text_model_combo.count()):
-            if self.text_model_combo.itemData(i) == config.model or self.text_model_combo.itemText(i) == config.model:
-                self.text_model_combo.setCurrentIndex(i)
-                break
-        else:
-             self.text_model_combo.setCurrentText(config.model)
-
-        # 图像模型
-        for i in range(self.image_model_combo.count()):
-            if self.image_model_combo.itemData(i) == config.image_model or self.image_model_combo.itemText(i) == config.image_model:
-                self.image_model_combo.setCurrentIndex(i)
-                break
-        else:
-             self.image_model_combo.setCurrentText(config.image_model)
-
-        # 生成参数
-        self.temperature_spin.setValue(config.temperature)
-        self.top_p_spin.setValue(config.top_p)
-
-        # 视频配置
-        for i in range(self.video_model_combo.count()):
-            if self.video_model_combo.itemData(i) == config.video_model or self.video_model_combo.itemText(i) == config.video_model:
-                self.video_model_combo.setCurrentIndex(i)
-                break
-        else:
-             self.video_model_combo.setCurrentText(config.video_model)
-
-        for i in range(self.aspect_ratio_combo.count()):
-            if self.aspect_ratio_combo.itemData(i) == config.video_aspect_ratio:
-                self.aspect_ratio_combo.setCurrentIndex(i)
-                break
-
-        for i in range(self.size_combo.count()):
-            if self.size_combo.itemData(i) == config.video_size:
-                self.size_combo.setCurrentIndex(i)
-                break
-
-        # 音乐配置
-        for i in range(self.music_model_combo.count()):
-            if self.music_model_combo.itemData(i) == config.music_model or self.music_model_combo.itemText(i) == config.music_model:
-                self.music_model_combo.setCurrentIndex(i)
-                break
-        else:
-             self.music_model_combo.setCurrentText(config.music_model)
-
-        self.music_tags_edit.setText(config.music_tags)
-
-        # 生成配置
-        self.example_count_spin.setValue(config.example_count)
-        self.style_anchors_check.setChecked(config.style_anchors)
+        # 模型下拉框延迟填充：此处只记录当前值，展开时再选中对应项
+        self._apply_values({key: getattr(config, key) for key, _ in self._FIELDS})
 
     def _save_config(self):
         """保存配置"""
         # 收集配置
         config_updates = {
-            'api_key': self.api_key_edit.text(),
-            'base_url': self.base_url_edit.text(),
-            'timeout': self.timeout_spin.value(),
-            'max_retries': self.max_retries_spin.value(),
-            'use_native_google': self.native_google_check.isChecked(),
-            'model': self.text_model_combo.currentData() or self.text_model_combo.currentText(),
-            'image_model': self.image_model_combo.currentData() or self.image_model_combo.currentText(),
-            'temperature': self.temperature_spin.value(),
-            'top_p': self.top_p_spin.value(),
-            'video_model': self.video_model_combo.currentData() or self.video_model_combo.currentText(),
-            'video_aspect_ratio': self.aspect_ratio_combo.currentData(),
-            'video_size': self.size_combo.currentData(),
-            'music_model': self.music_model_combo.currentData() or self.music_model_combo.currentText(),
-            'music_tags': self.music_tags_edit.text(),
-            'example_count': self.example_count_spin.value(),
-            'style_anchors': self.style_anchors_check.isChecked(),
+            key: _widget_value(getattr(self, attr)) for key, attr in self._FIELDS
         }
 
         # 验证 API Key
         if not config_updates['api_key'] or config_updates['api_key'] == "sk-xxx...":
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "配置错误", "请输入有效的 API Key")
             return
 
-        # 更新配置
-        self.app_state.update_config(**config_updates)
+        # 只提交有变化的项，没有变化时不写盘、不重置客户端、不发信号
+        delta = {
+            key: value for key, value in config_updates.items()
+            if getattr(self.config, key, None) != value
+        }
+        if not delta:
+            QMessageBox.information(self, "无变更", "配置没有变化")
+            return
+
+        # 配置在 GUI 线程生效（重置客户端、发信号），后台线程只负责写盘
+        snapshot = self.app_state.apply_config(**delta)
+        self.save_btn.setEnabled(False)
+        self._save_thread = ConfigSaveThread(self.app_state, snapshot)
+        self._save_thread.finished.connect(self._on_save_finished)
+        self._save_thread.start()
 
+    def _on_save_finished(self, success: bool, message: str):
+        """配置保存完成处理"""
+        self.save_btn.setEnabled(True)
         self.settings_changed.emit()
 
-        from PySide6.QtWidgets import QMessageBox
+        if not success:
+            QMessageBox.warning(self, "保存失败", f"配置已生效，但写入文件失败: {message}")
+            return
+
         QMessageBox.information(self, "保存成功", "配置已保存")
 
     def _reset_to_default(self):
         """重置为默认配置"""
-        from PySide6.QtWidgets import QMessageBox
-
         reply = QMessageBox.question(
             self,
             "重置配置",
@@ -411,17 +531,14 @@ class SettingsPanel(QWidget):
             QMessageBox.No
         )
 
-        if reply == QMessageBox.Yes:
-            self.api_key_edit.setText("sk-xxx...")
-            self.base_url_edit.setText("https://vipstar.vip")
-            self.timeout_spin.setValue(120)
-            self.max_retries_spin.setValue(5)
-            self.native_google_check.setChecked(False)
-            self.temperature_spin.setValue(0.7)
-            self.top_p_spin.setValue(0.9)
-            self.example_count_spin.setValue(3)
-            self.style_anchors_check.setChecked(True)
-            self.music_tags_edit.setText("chinese traditional,emotional")
+        if reply != QMessageBox.Yes:
+            return
+
+        defaults = APIConfig()
+        self._apply_values({
+            key: getattr(defaults, key)
+            for key, _ in self._FIELDS if key not in self._RESET_SKIP
+        })
 
     def _test_connection(self):
         """测试 API 连接"""
@@ -437,6 +554,10 @@ class SettingsPanel(QWidget):
             self._update_connection_status("error", "请输入 Base URL")
             return
 
+        # 上一次测试仍在进行时不重复发起请求
+        if self._test_thread is not None and self._test_thread.isRunning():
+            return
+
         # 禁用按钮并更新状态
         self.test_connection_btn.setEnabled(False)
         self.test_connection_btn.setText("测试中...")
@@ -444,6 +565,7 @@ class SettingsPanel(QWidget):
 
         # 启动测试线程
         self._test_thread = ConnectionTestThread(api_key, base_url)
+        self._test_thread.setObjectName("conn-test")
         self._test_thread.finished.connect(self._on_test_finished)
         self._test_thread.start()
 
@@ -461,21 +583,41 @@ class SettingsPanel(QWidget):
         else:
             self._update_connection_status("error", f"连接失败: {message}")
 
+    def cleanup(self):
+        """程序退出时的清理：通知测试线程放弃结果，等待配置写盘完成"""
+        if self._test_thread is not None and self._test_thread.isRunning():
+            self._test_thread.requestInterruption()
+            self._test_thread.wait(100)
+        if self._save_thread is not None and self._save_thread.isRunning():
+            self._save_thread.wait()
+
     def _update_connection_status(self, status: str, message: str):
         """更新连接状态显示"""
-        colors = {
-            "testing": "#FF9800",   # 橙色
-            "success": "#4CAF50",    # 绿色
-            "error": "#F44336",      # 红色
-        }
-
-        color = colors.get(status, "#999")
         self.connection_status_label.setText(message)
         self.connection_status_label.setStyleSheet(
-            f"color: {color}; padding: 5px; background-color: #f5f5f5; border-radius: 4px;"
+            self._STATUS_STYLES.get(status, self._DEFAULT_STATUS_STYLE)
         )
 
 
+class ConfigSaveThread(QThread):
+    """配置写盘线程（只写文件，不修改共享配置）"""
+
+    finished = Signal(bool, str)  # success, message
+
+    def __init__(self, app_state, snapshot):
+        super().__init__()
+        self.app_state = app_state
+        self.snapshot = snapshot
+
+    def run(self):
+        """写入配置"""
+        try:
+            self.app_state.save_config(self.snapshot)
+            self.finished.emit(True, "")
+        except Exception as e:
+            self.finished.emit(False, str(e))
+
+
 class ConnectionTestThread(QThread):
     """API 连接测试线程"""
 
@@ -485,60 +627,55 @@ class ConnectionTestThread(QThread):
         super().__init__()
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
-        self.timeout = 30
+        # 连接和读取分开计时：地址不可达时几秒内即失败
+        self.connect_timeout = 3
+        self.read_timeout = 15
+
+    def _emit(self, success: bool, message: str, latency: float = 0.0):
+        """发送结果（已请求中断时丢弃）"""
+        if not self.isInterruptionRequested():
+            self.finished.emit(success, message, latency)
 
     def run(self):
         """运行测试"""
-        import time
-        import requests
-
         try:
-            # 准备测试请求
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-
-            payload = {
-                "model": "gemini-2.5-flash",
-                "messages": [
-                    {"role": "user", "content": "Hello"}
-                ],
-                "max_tokens": 10
-            }
+            # 请求模型列表即可校验地址和 API Key，不触发推理、不消耗额度
+            headers = {"Authorization": f"Bearer {self.api_key}"}
 
             # 发送测试请求
             start_time = time.time()
 
-            response = requests.post(
-                f"{self.base_url}/v1/chat/completions",
+            response = _get_session().get(
+                f"{self.base_url}/v1/models",
                 headers=headers,
-                json=payload,
-                timeout=self.timeout
+                timeout=(self.connect_timeout, self.read_timeout)
             )
 
             latency = time.time() - start_time
 
             # 检查响应
             if response.status_code == 200:
-                self.finished.emit(True, "API 连接正常", latency)
+                self._emit(True, "API 连接正常", latency)
             elif response.status_code == 401:
-                self.finished.emit(False, "API Key 无效或已过期")
+                self._emit(False, "API Key 无效或已过期")
             elif response.status_code == 429:
-                self.finished.emit(False, "请求过于频繁，请稍后再试")
+                self._emit(False, "请求过于频繁，请稍后再试")
             elif response.status_code == 500:
-                self.finished.emit(False, "服务器内部错误")
+                self._emit(False, "服务器内部错误")
             else:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-                except:
-                    error_msg = f"HTTP {response.status_code}"
-                self.finished.emit(False, error_msg)
+                error_msg = f"HTTP {response.status_code}"
+                # 只有 JSON 响应才尝试解析错误信息（HTML 错误页直接跳过）
+                if "json" in response.headers.get("Content-Type", ""):
+                    try:
+                        error_data = _loads(response.content)
+                        error_msg = error_data.get("error", {}).get("message", error_msg)
+                    except (ValueError, AttributeError):
+                        pass
+                self._emit(False, error_msg)
 
         except requests.exceptions.Timeout:
-            self.finished.emit(False, "连接超时，请检查网络或 Base URL")
+            self._emit(False, "连接超时，请检查网络或 Base URL")
         except requests.exceptions.ConnectionError:
-            self.finished.emit(False, "无法连接到服务器，请检查 Base URL")
+            self._emit(False, "无法连接到服务器，请检查 Base URL")
         except Exception as e:
-            self.finished.emit(False, f"未知错误: {str(e)}")
+            self._emit(False, f"未知错误: {str(e)}")
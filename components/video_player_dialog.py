@@ -3,73 +3,322 @@
 内置视频播放功能，支持播放控制、进度条、音量调节
 """
 from typing import Optional
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
-    QSlider, QLabel, QStyle, QSizePolicy, QProgressBar
+    QSlider, QLabel, QStyle, QSizePolicy, QProgressBar,
+    QMessageBox, QFileDialog, QTextEdit, QDialogButtonBox
+)
+from PySide6.QtCore import (
+    Qt, QUrl, Signal, Slot, QObject, QRunnable, QThreadPool, QTimer, QStandardPaths
 )
-from PySide6.QtCore import Qt, QUrl, Signal, Slot, QThread, QStandardPaths
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimediaWidgets import QVideoWidget
 import tempfile
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 
 
-class VideoDownloadThread(QThread):
-    """视频下载线程"""
+# 视频缓存：文件名为 URL 的哈希，按最近访问时间淘汰，总大小不超过上限
+_CACHE_DIR = Path(tempfile.gettempdir()) / "guui_video_cache"
+_CACHE_INDEX = _CACHE_DIR / "index.json"
+_MAX_CACHE_BYTES = 2 * 1024 ** 3
+_cache_lock = threading.Lock()
+
+# 下载时每次读写的块大小（同时用作文件写缓冲大小）
+_COPY_CHUNK = 1024 * 1024
+
+# 视频下载共用的 HTTP 会话（复用连接，分段下载的并发连接也从同一连接池获取）
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """获取（首次调用时创建）视频下载用的 requests.Session"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def _cache_path(url: str) -> Path:
+    """视频 URL 对应的缓存文件路径"""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return _CACHE_DIR / f"{key}.mp4"
+
+
+def _touch_cache(path: Path) -> None:
+    """记录缓存文件的访问时间，并按 LRU 淘汰超出容量上限的旧文件"""
+    with _cache_lock:
+        try:
+            index = json.loads(_CACHE_INDEX.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            index = {}
+
+        index[path.name] = [path.stat().st_size, time.time()]
+
+        # 清理已不存在的文件，再从最久未访问的开始淘汰
+        index = {name: entry for name, entry in index.items() if (_CACHE_DIR / name).exists()}
+        total = sum(size for size, _ in index.values())
+        for name, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+            if total <= _MAX_CACHE_BYTES:
+                break
+            if name == path.name:
+                continue
+            try:
+                (_CACHE_DIR / name).unlink(missing_ok=True)
+            except OSError:
+                continue  # 文件正被其他播放器占用（Windows），保留在索引中，下次再淘汰
+            _meta_path(_CACHE_DIR / name).unlink(missing_ok=True)
+            del index[name]
+            total -= size
+
+        _CACHE_INDEX.write_text(json.dumps(index), encoding='utf-8')
+
+
+def _meta_path(path: Path) -> Path:
+    """缓存文件对应的校验信息（ETag / Last-Modified）文件"""
+    return path.with_suffix('.meta.json')
+
+
+def _validators(headers) -> dict:
+    """从响应头提取用于条件请求的校验信息"""
+    return {
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+    }
+
+
+@lru_cache(maxsize=8192)
+def _format_seconds(seconds: int) -> str:
+    """格式化时间（秒 -> MM:SS），播放时按秒重复调用，结果缓存"""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def _preallocate(f, size: int) -> None:
+    """按已知大小预分配文件空间，减少边写边扩展带来的碎片和元数据更新"""
+    if hasattr(os, 'posix_fallocate'):
+        os.posix_fallocate(f.fileno(), 0, size)
+    else:
+        f.truncate(size)
+
+
+class _ProgressReader:
+    """包装 response.raw 供 shutil.copyfileobj 读取
+
+    每读到一块数据回调 on_read(字节数)，回调返回 False 时结束读取（用于取消下载）。
+    """
+
+    __slots__ = ('_raw', '_on_read')
+
+    def __init__(self, raw, on_read):
+        raw.decode_content = True
+        self._raw = raw
+        self._on_read = on_read
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        if data and not self._on_read(len(data)):
+            return b''
+        return data
+
+
+class VideoDownloadSignals(QObject):
+    """视频下载任务的信号（QRunnable 不是 QObject，信号放在单独的对象上）"""
     progress = Signal(int)
     finished = Signal(str)
     error = Signal(str)
+
+
+class VideoDownloadTask(QRunnable):
+    """视频下载任务，提交到全局线程池执行
+
+    服务器支持 Range 且文件较大时分段并行下载，否则单连接下载。
+    """
+
+    SEGMENTS = 4                           # 并行分段数
+    MIN_SEGMENTED_SIZE = 8 * 1024 * 1024   # 小于该大小时不分段
     
     def __init__(self, url: str):
         super().__init__()
         self.url = url
-        self._stopped = False
+        self.signals = VideoDownloadSignals()
+        self._stop_event = threading.Event()
+        self._downloaded = 0
+        self._lock = threading.Lock()
+        self._last_percent = -1
+        self._last_emit = 0.0
+        self._validators = {}
         
     def stop(self):
-        self._stopped = True
+        self._stop_event.set()
+
+    def _report_progress(self, downloaded: int, total_size: int):
+        """发送下载进度：百分比变化且距上次发送超过 50ms 才发送（最多 20 次/秒）"""
+        percent = int(downloaded / total_size * 100)
+        now = time.monotonic()
+        if percent != self._last_percent and now - self._last_emit > 0.05:
+            self._last_percent = percent
+            self._last_emit = now
+            self.signals.progress.emit(percent)
         
     def run(self):
         try:
-            # 创建临时文件
-            temp_dir = Path(tempfile.gettempdir()) / "guui_video_cache"
-            temp_dir.mkdir(exist_ok=True)
-            
-            filename = self.url.split('/')[-1].split('?')[0]
-            if not filename.endswith('.mp4'):
-                filename += '.mp4'
-                
-            save_path = temp_dir / filename
+            _CACHE_DIR.mkdir(exist_ok=True)
+            save_path = _cache_path(self.url)
             
-            # 如果文件已存在且大小正常，直接使用
-            if save_path.exists() and save_path.stat().st_size > 0:
-                self.finished.emit(str(save_path))
+            # 如果文件已存在且服务器上的视频未变化，直接使用
+            if save_path.exists() and save_path.stat().st_size > 0 and self._cache_is_fresh(save_path):
+                _touch_cache(save_path)
+                self.signals.finished.emit(str(save_path))
                 return
-            
-            # 下载
-            response = requests.get(self.url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if self._stopped:
-                        return
-                        
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            self.progress.emit(int(downloaded / total_size * 100))
-                            
-            self.finished.emit(str(save_path))
+
+            # 先写入本任务独占的临时文件，完整下载后再改名；取消或失败时删除临时文件，不留下残缺的缓存
+            fd, part_name = tempfile.mkstemp(dir=_CACHE_DIR, prefix=save_path.stem + '.', suffix='.part')
+            os.close(fd)
+            part_path = Path(part_name)
+            try:
+                total_size = self._probe_ranged_size()
+                if total_size >= self.MIN_SEGMENTED_SIZE:
+                    self._download_segmented(part_path, total_size)
+                else:
+                    self._download_single(part_path)
+
+                if self._stop_event.is_set():
+                    return
+
+                try:
+                    part_path.replace(save_path)
+                except OSError:
+                    # 其他任务已下载好同一视频且文件正被播放占用（Windows），直接使用已有文件
+                    if not save_path.exists():
+                        raise
+            finally:
+                part_path.unlink(missing_ok=True)  # 改名成功后已不存在
+            _meta_path(save_path).write_text(json.dumps(self._validators), encoding='utf-8')
+            _touch_cache(save_path)
+            self.signals.progress.emit(100)
+            self.signals.finished.emit(str(save_path))
             
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+    def _cache_is_fresh(self, save_path: Path) -> bool:
+        """用 ETag / Last-Modified 发送条件 HEAD 请求，判断缓存是否仍然有效
+
+        没有校验信息或网络不可用时沿用缓存。
+        """
+        try:
+            meta = json.loads(_meta_path(save_path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return True
 
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        if not headers:
+            return True
+
+        try:
+            response = _get_session().head(self.url, headers=headers, allow_redirects=True, timeout=30)
+        except requests.RequestException:
+            return True
+        if response.status_code == 304:
+            return True
+        return response.ok and _validators(response.headers) == meta
+
+    def _probe_ranged_size(self) -> int:
+        """HEAD 探测文件大小；服务器不支持 Range 或探测失败时返回 0"""
+        try:
+            response = _get_session().head(self.url, allow_redirects=True, timeout=30)
+        except requests.RequestException:
+            return 0
+        self._validators = _validators(response.headers)
+        if not response.ok or response.headers.get('accept-ranges', '').lower() != 'bytes':
+            return 0
+        return int(response.headers.get('content-length', 0))
+
+    def _download_single(self, part_path: Path):
+        """单连接下载"""
+        response = _get_session().get(self.url, stream=True, timeout=30)
+        response.raise_for_status()
+        self._validators = _validators(response.headers)
+        
+        total_size = int(response.headers.get('content-length', 0))
+
+        def on_read(size: int) -> bool:
+            self._downloaded += size
+            if total_size > 0:
+                self._report_progress(self._downloaded, total_size)
+            return not self._stop_event.is_set()
+        
+        with open(part_path, 'wb', buffering=_COPY_CHUNK) as f:
+            if total_size > 0:
+                _preallocate(f, total_size)
+            shutil.copyfileobj(_ProgressReader(response.raw, on_read), f, _COPY_CHUNK)
+            f.truncate()  # 实际长度与 content-length 不一致时以实际写入为准
+
+    def _download_segmented(self, part_path: Path, total_size: int):
+        """按字节范围分段，多个连接并行写入预分配的文件"""
+        with open(part_path, 'wb') as f:
+            _preallocate(f, total_size)
+
+        step = -(-total_size // self.SEGMENTS)
+        ranges = [(start, min(start + step, total_size) - 1)
+                  for start in range(0, total_size, step)]
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(self._download_range, part_path, start, end)
+                       for start, end in ranges]
+
+            # 汇总各分段进度，定时发送而不是每个数据块都发
+            pending = futures
+            while pending:
+                done, pending = wait(pending, timeout=0.1)
+                if any(future.exception() for future in done):
+                    self._stop_event.set()  # 任一分段失败即停止其余分段
+                with self._lock:
+                    downloaded = self._downloaded
+                self._report_progress(downloaded, total_size)
+
+            for future in futures:
+                future.result()  # 抛出分段下载中的异常
+
+    def _download_range(self, part_path: Path, start: int, end: int):
+        """下载 [start, end] 字节范围并写入文件对应位置"""
+        response = _get_session().get(
+            self.url, headers={'Range': f'bytes={start}-{end}'},
+            stream=True, timeout=30
+        )
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise RuntimeError(f"服务器未按范围返回数据 (HTTP {response.status_code})")
+
+        def on_read(size: int) -> bool:
+            with self._lock:
+                self._downloaded += size
+            return not self._stop_event.is_set()
+
+        with open(part_path, 'r+b', buffering=_COPY_CHUNK) as f:
+            f.seek(start)
+            shutil.copyfileobj(_ProgressReader(response.raw, on_read), f, _COPY_CHUNK)
 
 
 class VideoPlayerDialog(QDialog):
@@ -89,8 +338,20 @@ class VideoPlayerDialog(QDialog):
         """
         super().__init__(parent)
         
+        # file:// 地址按本地文件处理：直接播放，不经过下载缓存
+        if video_url.startswith('file://'):
+            video_url = QUrl(video_url).toLocalFile()
+
         self.video_url = video_url
         self.metadata = metadata or {}
+        self._is_remote = video_url.startswith(('http://', 'https://'))
+        self._save_path = None            # "下载视频"的目标路径（下载完成后复制过去）
+        self._regen_dialog = None
+        # 同一时间只有一个任务下载本视频，流式播放失败的回退和"下载视频"共用
+        self._cache_task = None
+        self._cache_running = False
+        self._fallback_started = False    # 是否已退回到下载后播放
+        self._play_when_cached = False    # 下载完成后是否播放
         
         self._init_ui()
         self._init_player()
@@ -136,8 +397,12 @@ class VideoPlayerDialog(QDialog):
         layout = QHBoxLayout()
         
         # 播放/暂停按钮
+        # 播放/暂停图标只取一次，切换状态时直接复用
+        self._icon_play = self.style().standardIcon(QStyle.SP_MediaPlay)
+        self._icon_pause = self.style().standardIcon(QStyle.SP_MediaPause)
+
         self.play_button = QPushButton()
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.play_button.setIcon(self._icon_play)
         self.play_button.setToolTip("播放/暂停 (空格)")
         self.play_button.clicked.connect(self._toggle_play)
         layout.addWidget(self.play_button)
@@ -232,9 +497,9 @@ class VideoPlayerDialog(QDialog):
         layout.addWidget(regenerate_btn)
         
         # 下载按钮
-        download_btn = QPushButton("📥 下载视频")
-        download_btn.clicked.connect(self._download_video)
-        layout.addWidget(download_btn)
+        self.download_btn = QPushButton("📥 下载视频")
+        self.download_btn.clicked.connect(self._download_video)
+        layout.addWidget(self.download_btn)
         
         # 关闭按钮
         close_btn = QPushButton("❌ 关闭")
@@ -251,11 +516,17 @@ class VideoPlayerDialog(QDialog):
         self.player.setAudioOutput(self.audio_output)
         self.player.setVideoOutput(self.video_widget)
         
-        # 连接信号
-        self.player.positionChanged.connect(self._update_position)
-        self.player.durationChanged.connect(self._update_duration)
-        self.player.playbackStateChanged.connect(self._on_state_changed)
-        self.player.mediaStatusChanged.connect(self._on_media_status_changed)
+        # 播放位置按 4Hz 刷新界面（positionChanged 触发频率远高于秒级显示所需）
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(250)
+        self._ui_timer.timeout.connect(self._refresh_position_ui)
+
+        # 连接信号（UniqueConnection：重复连接时不会让槽函数执行多次）
+        self.player.durationChanged.connect(self._update_duration, Qt.UniqueConnection)
+        self.player.playbackStateChanged.connect(self._on_state_changed, Qt.UniqueConnection)
+        self.player.mediaStatusChanged.connect(self._on_media_status_changed, Qt.UniqueConnection)
+        self.player.bufferProgressChanged.connect(self._on_buffer_progress, Qt.UniqueConnection)
+        self.player.errorOccurred.connect(self._on_player_error, Qt.UniqueConnection)
         
         # 设置音量
         self.audio_output.setVolume(0.7)
@@ -265,45 +536,99 @@ class VideoPlayerDialog(QDialog):
     
     def _load_video(self):
         """加载视频"""
-        if self.video_url.startswith(('http://', 'https://')):
-            # 显示加载状态
+        if self._is_remote:
+            # 在线视频直接交给播放器流式播放，无需等待整个文件下载完成；
+            # 播放器报错时再退回到下载缓存（见 _on_player_error）
             self.loading_bar.show()
             self.loading_bar.setValue(0)
-            self.play_button.setEnabled(False)
-            
-            # 启动下载线程
-            self.download_thread = VideoDownloadThread(self.video_url)
-            self.download_thread.progress.connect(self.loading_bar.setValue)
-            self.download_thread.finished.connect(self._on_video_ready)
-            self.download_thread.error.connect(self._on_video_error)
-            self.download_thread.start()
+            url = QUrl(self.video_url)
         else:
             # 本地文件直接播放
             url = QUrl.fromLocalFile(self.video_url)
-            self.player.setSource(url)
-            self.player.play()
-            
+
+        self.player.setSource(url)
+        self.player.play()
+
+    @Slot(QMediaPlayer.Error, str)
+    def _on_player_error(self, error, error_string: str):
+        """流式播放失败时，退回到先下载到本地缓存再播放"""
+        if not self._is_remote or self._fallback_started:
+            QMessageBox.warning(self, "加载失败", f"无法加载视频: {error_string}")
+            return
+
+        self._fallback_started = True
+        self._play_when_cached = True
+        self.loading_bar.setFormat("正在下载视频... %p%")
+        self.loading_bar.setValue(0)
+        self.loading_bar.show()
+        self.play_button.setEnabled(False)
+        self._ensure_cache_task()
+
+    def _ensure_cache_task(self):
+        """启动下载到缓存的任务；已有任务在下载时直接沿用，不重复下载"""
+        if self._cache_running:
+            return
+
+        self._cache_task = VideoDownloadTask(self.video_url)
+        self._cache_task.setAutoDelete(False)  # 由对话框持有引用
+        # 任务在线程池中发出信号，显式排队到界面线程处理
+        self._cache_task.signals.progress.connect(self._on_cache_progress, Qt.QueuedConnection)
+        self._cache_task.signals.finished.connect(self._on_cache_finished, Qt.QueuedConnection)
+        self._cache_task.signals.error.connect(self._on_cache_error, Qt.QueuedConnection)
+        self._cache_running = True
+        QThreadPool.globalInstance().start(self._cache_task)
+
+    @Slot(int)
+    def _on_cache_progress(self, percent: int):
+        """下载进度：分发给播放回退和"下载视频"按钮"""
+        if self._play_when_cached:
+            self.loading_bar.setValue(percent)
+        if self._save_path is not None:
+            self._on_download_progress(percent)
+
+    @Slot(str)
+    def _on_cache_finished(self, local_path: str):
+        """下载完成"""
+        self._cache_running = False
+        if self._play_when_cached:
+            self._play_when_cached = False
+            self._on_video_ready(local_path)
+        if self._save_path is not None:
+            self._on_download_finished(local_path)
+
+    @Slot(str)
+    def _on_cache_error(self, error_msg: str):
+        """下载失败"""
+        self._cache_running = False
+        if self._play_when_cached:
+            self._play_when_cached = False
+            self._on_video_error(error_msg)
+        if self._save_path is not None:
+            self._on_download_error(error_msg)
+
+    @Slot(str)
     def _on_video_ready(self, local_path: str):
-        """视频下载完成"""
+        """视频下载完成，改为播放本地文件"""
         self.loading_bar.hide()
         self.play_button.setEnabled(True)
         self.video_url = local_path  # 更新为本地路径
-        
-        url = QUrl.fromLocalFile(local_path)
-        self.player.setSource(url)
+        self._is_remote = False
+
+        self.player.setSource(QUrl.fromLocalFile(local_path))
         self.player.play()
-        
+
+    @Slot(str)
     def _on_video_error(self, error_msg: str):
         """视频下载失败"""
         self.loading_bar.hide()
-        from PySide6.QtWidgets import QMessageBox
-        QMessageBox.warning(self, "加载失败", f"无法加载视频: {error_msg}\n\n将尝试流式播放...")
-        
-        # 降级由于流式播放
-        url = QUrl(self.video_url)
-        self.player.setSource(url)
-        self.player.play()
         self.play_button.setEnabled(True)
+        QMessageBox.warning(self, "加载失败", f"无法加载视频: {error_msg}")
+
+    @Slot(float)
+    def _on_buffer_progress(self, progress: float):
+        """缓冲进度变化"""
+        if not self._fallback_started:
+            self.loading_bar.setValue(int(progress * 100))
     
     @Slot()
     def _toggle_play(self):
@@ -322,15 +647,18 @@ class VideoPlayerDialog(QDialog):
     def _set_position(self, position: int):
         """设置播放位置"""
         self.player.setPosition(position)
+        self._refresh_position_ui()
     
     @Slot(int)
     def _set_volume(self, volume: int):
         """设置音量"""
         self.audio_output.setVolume(volume / 100.0)
     
-    @Slot(int)
-    def _update_position(self, position: int):
-        """更新播放位置"""
+    @Slot()
+    def _refresh_position_ui(self):
+        """刷新播放位置显示"""
+        position = self.player.position()
+
         # 更新进度条（避免循环触发）
         if not self.position_slider.isSliderDown():
             self.position_slider.setValue(position)
@@ -348,14 +676,25 @@ class VideoPlayerDialog(QDialog):
     def _on_state_changed(self):
         """播放状态变化"""
         if self.player.playbackState() == QMediaPlayer.PlayingState:
-            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+            self.play_button.setIcon(self._icon_pause)
+            self._ui_timer.start()
         else:
-            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+            self.play_button.setIcon(self._icon_play)
+            self._ui_timer.stop()
+            self._refresh_position_ui()
     
     @Slot()
     def _on_media_status_changed(self):
         """媒体状态变化"""
         status = self.player.mediaStatus()
+
+        # 在线视频缓冲状态（退回下载时进度条显示下载进度）
+        if self._is_remote and not self._fallback_started:
+            if status in (QMediaPlayer.LoadingMedia, QMediaPlayer.BufferingMedia,
+                          QMediaPlayer.StalledMedia):
+                self.loading_bar.show()
+            else:
+                self.loading_bar.hide()
         
         # 视频播放结束
         if status == QMediaPlayer.EndOfMedia:
@@ -378,8 +717,22 @@ class VideoPlayerDialog(QDialog):
     @Slot()
     def _on_regenerate(self):
         """发起重新生成请求"""
-        from PySide6.QtWidgets import QMessageBox, QDialog, QVBoxLayout, QLabel, QTextEdit, QDialogButtonBox
+        current_prompt = self.metadata.get('prompt') or ''
+
+        edit_dialog = self._get_regen_dialog()
+        self._regen_text_edit.setPlainText(current_prompt)
         
+        if edit_dialog.exec() == QDialog.Accepted:
+            new_prompt = self._regen_text_edit.toPlainText().strip()
+            if new_prompt:
+                self.regenerate_requested.emit(new_prompt)
+                QMessageBox.information(self, "提示", "已提交重新生成任务，请在视频队列中查看")
+
+    def _get_regen_dialog(self) -> QDialog:
+        """获取提示词编辑对话框（首次使用时创建，之后复用）"""
+        if self._regen_dialog is not None:
+            return self._regen_dialog
+
         current_prompt = self.metadata.get('prompt') or ''
         
         # 创建自定义编辑对话框
@@ -393,39 +746,31 @@ class VideoPlayerDialog(QDialog):
         hint_label = QLabel("请编辑视频提示词（英文），包含运镜、动画风格等描述：")
         layout.addWidget(hint_label)
         
-        # 显示原提示词
+        # 显示原提示词（元数据在对话框生命周期内不变）
         if current_prompt:
-            original_label = QLabel(f"原提示词: {current_prompt[:80]}...")
-            original_label.setStyleSheet("color: #666; font-size: 10px;")
-            original_label.setWordWrap(True)
-            layout.addWidget(original_label)
+            self._regen_original_label = QLabel(f"原提示词: {current_prompt[:80]}...")
+            self._regen_original_label.setStyleSheet("color: #666; font-size: 10px;")
+            self._regen_original_label.setWordWrap(True)
+            layout.addWidget(self._regen_original_label)
         
         # 多行文本编辑器
-        text_edit = QTextEdit()
-        text_edit.setPlainText(current_prompt)
-        text_edit.setPlaceholderText("Slow camera pan across traditional Chinese landscape, gentle ink flow animation, serene atmosphere...")
-        layout.addWidget(text_edit)
+        self._regen_text_edit = QTextEdit()
+        self._regen_text_edit.setPlaceholderText("Slow camera pan across traditional Chinese landscape, gentle ink flow animation, serene atmosphere...")
+        layout.addWidget(self._regen_text_edit)
         
         # 按钮
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(edit_dialog.accept)
         buttons.rejected.connect(edit_dialog.reject)
         layout.addWidget(buttons)
-        
-        if edit_dialog.exec() == QDialog.Accepted:
-            new_prompt = text_edit.toPlainText().strip()
-            if new_prompt:
-                self.regenerate_requested.emit(new_prompt)
-                QMessageBox.information(self, "提示", "已提交重新生成任务，请在视频队列中查看")
+
+        self._regen_dialog = edit_dialog
+        return self._regen_dialog
 
     
     @Slot()
     def _download_video(self):
         """下载视频"""
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
-        import requests
-        from pathlib import Path
-        
         # 选择保存位置
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -434,32 +779,56 @@ class VideoPlayerDialog(QDialog):
             "视频文件 (*.mp4 *.mov *.avi)"
         )
         
-        if file_path:
-            try:
-                if self.video_url.startswith(('http://', 'https://')):
-                    # 下载在线视频
-                    response = requests.get(self.video_url, stream=True)
-                    response.raise_for_status()
-                    
-                    with open(file_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                else:
-                    # 复制本地文件
-                    import shutil
-                    shutil.copy(self.video_url, file_path)
-                
-                QMessageBox.information(self, "成功", f"视频已保存到:\n{file_path}")
-                
-            except Exception as e:
-                QMessageBox.warning(self, "下载失败", f"错误: {str(e)}")
+        if not file_path:
+            return
+
+        if self._is_remote:
+            # 在线视频在后台线程下载到缓存，完成后再复制到目标位置
+            self._save_path = file_path
+            self.download_btn.setEnabled(False)
+            self.download_btn.setText("📥 下载中...")
+
+            self._ensure_cache_task()
+            return
+
+        try:
+            # 复制本地文件
+            shutil.copy(self.video_url, file_path)
+            QMessageBox.information(self, "成功", f"视频已保存到:\n{file_path}")
+        except Exception as e:
+            QMessageBox.warning(self, "下载失败", f"错误: {str(e)}")
+
+    @Slot(int)
+    def _on_download_progress(self, percent: int):
+        """下载进度"""
+        self.download_btn.setText(f"📥 下载中 {percent}%")
+
+    @Slot(str)
+    def _on_download_finished(self, local_path: str):
+        """视频下载完成"""
+        save_path, self._save_path = self._save_path, None
+        self._reset_download_button()
+        try:
+            shutil.copy(local_path, save_path)
+            QMessageBox.information(self, "成功", f"视频已保存到:\n{save_path}")
+        except Exception as e:
+            QMessageBox.warning(self, "下载失败", f"错误: {str(e)}")
+
+    @Slot(str)
+    def _on_download_error(self, error_msg: str):
+        """视频下载失败"""
+        self._save_path = None
+        self._reset_download_button()
+        QMessageBox.warning(self, "下载失败", f"错误: {error_msg}")
+
+    def _reset_download_button(self):
+        """恢复下载按钮"""
+        self.download_btn.setEnabled(True)
+        self.download_btn.setText("📥 下载视频")
     
     def _format_time(self, ms: int) -> str:
         """格式化时间（毫秒 -> MM:SS）"""
-        seconds = ms // 1000
-        minutes = seconds // 60
-        seconds = seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
+        return _format_seconds(ms // 1000)
     
     def keyPressEvent(self, event):
         """键盘事件处理"""
@@ -472,10 +841,16 @@ class VideoPlayerDialog(QDialog):
         else:
             super().keyPressEvent(event)
     
-    def closeEvent(self, event):
-        """关闭事件"""
+    def done(self, result: int):
+        """关闭对话框（关闭按钮、Esc、accept/reject 都经过这里）
+
+        不等待下载任务结束（网络卡住时会阻塞界面）。用户选择了"下载视频"时让任务继续，
+        完成后照常复制到目标位置并提示；否则通知任务停止并屏蔽其信号，关闭后不再有回调。
+        """
+        self._ui_timer.stop()
         self.player.stop()
-        if hasattr(self, 'download_thread') and self.download_thread.isRunning():
-            self.download_thread.stop()
-            self.download_thread.wait()
-        super().closeEvent(event)
+        self._play_when_cached = False  # 关闭后不再播放
+        if self._cache_running and self._save_path is None:
+            self._cache_task.stop()
+            self._cache_task.signals.blockSignals(True)
+        super().done(result)
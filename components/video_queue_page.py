@@ -2,21 +2,304 @@
 视频队列页面
 视频任务列表、状态刷新、视频预览
 """
-from typing import List, Optional, Dict
+import os
+from typing import List, Optional, Dict, Set
 from pathlib import Path
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableView, QHeaderView, QAbstractItemView,
     QPushButton, QLabel, QGroupBox, QProgressBar,
-    QMessageBox, QFileDialog, QMenu
+    QMessageBox, QFileDialog, QMenu, QApplication
+)
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
+from PySide6.QtCore import (
+    Signal, Qt, QThread, QTimer, QEvent, QRect, QSize,
+    QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, Slot
+)
+from PySide6.QtGui import (
+    QAction, QColor, QBrush, QPainter, QPixmap, QPixmapCache, QImage,
+    QStandardItemModel, QStandardItem
 )
-from PySide6.QtCore import Signal, Qt, QThread, QTimer
-from PySide6.QtGui import QAction, QColor, QBrush
 
 from core.app import get_app_state
 from schemas.video_task import VideoTask, VideoTaskStatus
 
 
+# 状态颜色（画刷只创建一次，模型查询时直接复用）
+_STATUS_BRUSHES: Dict[VideoTaskStatus, QBrush] = {
+    status: QBrush(QColor(color))
+    for status, color in {
+        # 通用状态
+        VideoTaskStatus.PENDING: "#999999",
+        VideoTaskStatus.SUBMITTED: "#2196F3",
+        VideoTaskStatus.QUEUED: "#FF9800",
+        VideoTaskStatus.PROCESSING: "#9C27B0",
+        VideoTaskStatus.COMPLETED: "#4CAF50",
+        VideoTaskStatus.FAILED: "#F44336",
+        VideoTaskStatus.CANCELLED: "#757575",
+        VideoTaskStatus.ERROR: "#D32F2F",
+        # Veo 子状态
+        VideoTaskStatus.IMAGE_DOWNLOADING: "#7B1FA2",
+        VideoTaskStatus.VIDEO_GENERATING: "#8E24AA",
+        VideoTaskStatus.VIDEO_UPSAMPLING: "#AB47BC",
+    }.items()
+}
+_DEFAULT_BRUSH = QBrush(QColor("#000000"))
+_DEFAULT_ALIGN = Qt.AlignCenter
+_ITEM_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+
+THUMB_SIZE = 100
+_IMAGE_PATH_ROLE = Qt.UserRole
+_VIDEO_PROMPT_ROLE = Qt.UserRole + 1
+
+
+def _thumb_key(path: str) -> Optional[str]:
+    """缩略图缓存键（路径 + 修改时间，文件变化后自动失效）；文件不存在时返回 None"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return f"video-thumb:{path}:{mtime}"
+
+
+class ThumbnailSignals(QObject):
+    """缩略图任务的信号（QRunnable 不是 QObject，信号放在单独的对象上）"""
+    loaded = Signal(str, QImage)  # (缓存键, 缩放后的图片)
+
+
+class ThumbnailTask(QRunnable):
+    """在线程池中解码并缩放图片（QImage 可在非 GUI 线程使用，QPixmap 不行）"""
+
+    def __init__(self, key: str, path: str, signals: ThumbnailSignals):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        image = QImage(self.path)
+        if not image.isNull():
+            image = image.scaled(THUMB_SIZE, THUMB_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.loaded.emit(self.key, image)
+
+
+class PollerWorker(QObject):
+    """任务状态查询（运行在常驻轮询线程中，HTTP 请求不阻塞 UI）"""
+
+    result_ready = Signal(str, dict)   # (task_id, 接口返回的状态)
+    error = Signal(str, str)           # (task_id, 错误信息)
+    round_finished = Signal()
+
+    def __init__(self, app_state):
+        super().__init__()
+        self.app_state = app_state
+
+    @Slot(list)
+    def poll(self, task_ids: list):
+        client = self.app_state.video_client
+        for task_id in task_ids:
+            if QThread.currentThread().isInterruptionRequested():
+                break
+            try:
+                self.result_ready.emit(task_id, client.get_task_status(task_id))
+            except Exception as e:
+                self.error.emit(task_id, str(e))
+        self.round_finished.emit()
+
+
+class VideoTaskModel(QAbstractTableModel):
+    """
+    视频任务表格模型
+
+    直接读取 VideoTask 对象，状态更新只发 dataChanged，不重新创建单元格。
+    """
+
+    HEADERS = ["任务 ID", "诗句", "提示词", "模型", "状态", "时长", "创建时间", "操作"]
+    (COL_ID, COL_VERSE, COL_PROMPT, COL_MODEL,
+     COL_STATUS, COL_DURATION, COL_CREATED, COL_ACTIONS) = range(8)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks: List[VideoTask] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._status_text: Dict[str, str] = {}  # task_id -> API 原始状态的显示文本
+
+    # ---------- 结构 ----------
+
+    def task_at(self, row: int) -> VideoTask:
+        """获取指定行的任务"""
+        return self._tasks[row]
+
+    def append_tasks(self, tasks: List[VideoTask]) -> None:
+        """在末尾批量追加任务（一次 beginInsertRows）"""
+        if not tasks:
+            return
+        first = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(tasks) - 1)
+        for row, task in enumerate(tasks, first):
+            self._tasks.append(task)
+            self._id_to_row[task.task_id] = row
+        self.endInsertRows()
+
+    def remove_task(self, row: int) -> None:
+        """删除指定行，并修正其后各行的索引"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        task = self._tasks.pop(row)
+        self._id_to_row.pop(task.task_id, None)
+        self._status_text.pop(task.task_id, None)
+        for i in range(row, len(self._tasks)):
+            self._id_to_row[self._tasks[i].task_id] = i
+        self.endRemoveRows()
+
+    def update_status(self, task_id: str, api_status: str) -> None:
+        """刷新任务状态（显示 API 原始状态，颜色按枚举状态）"""
+        row = self._id_to_row.get(task_id)
+        if row is None:
+            return
+        self._status_text[task_id] = api_status.replace("_", " ").title()
+        # 完成时会同时写入时长，一并刷新
+        self.dataChanged.emit(
+            self.index(row, self.COL_STATUS),
+            self.index(row, self.COL_DURATION),
+            [Qt.DisplayRole, Qt.ForegroundRole]
+        )
+
+    # ---------- QAbstractTableModel 接口 ----------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        task = self._tasks[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == self.COL_ID:
+                return task.task_id
+            if column == self.COL_VERSE:
+                return f"诗句 {task.verse_index}"
+            if column == self.COL_PROMPT:
+                return str(task.video_prompt)[:50] + "..." if task.video_prompt else ""
+            if column == self.COL_MODEL:
+                return task.model
+            if column == self.COL_STATUS:
+                return self._status_text.get(task.task_id, task.status.value)
+            if column == self.COL_DURATION:
+                return f"{task.duration:.1f}s" if task.duration else "-"
+            if column == self.COL_CREATED:
+                return task.created_at.strftime("%H:%M:%S")
+            return None
+
+        if column == self.COL_STATUS:
+            if role == Qt.ForegroundRole:
+                return _STATUS_BRUSHES.get(task.status, _DEFAULT_BRUSH)
+            if role == Qt.TextAlignmentRole:
+                return _DEFAULT_ALIGN
+
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return _ITEM_FLAGS
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """
+    操作列委托
+
+    直接绘制“预览 / 下载”两个按钮，代替每行的 QPushButton 控件；
+    按钮外观按主题、状态和 DPR 缓存到 QPixmapCache。
+    """
+
+    action_triggered = Signal(int, str)  # (row, "preview" | "download")
+
+    ACTIONS = (("preview", "预览"), ("download", "下载"))
+    BUTTON_WIDTH = 50
+    SPACING = 5
+    MARGIN = 5
+
+    def sizeHint(self, option, index) -> QSize:
+        count = len(self.ACTIONS)
+        width = self.MARGIN * 2 + self.BUTTON_WIDTH * count + self.SPACING * (count - 1)
+        return QSize(width, option.fontMetrics.height() + 10)
+
+    def _button_rects(self, rect: QRect) -> List[QRect]:
+        """按钮在单元格中的位置"""
+        height = min(rect.height() - 4, 24)
+        top = rect.top() + (rect.height() - height) // 2
+        left = rect.left() + self.MARGIN
+        rects = []
+        for _ in self.ACTIONS:
+            rects.append(QRect(left, top, self.BUTTON_WIDTH, height))
+            left += self.BUTTON_WIDTH + self.SPACING
+        return rects
+
+    def _button_pixmap(self, option, size: QSize) -> QPixmap:
+        """取（或绘制并缓存）单个单元格的按钮图"""
+        palette = option.palette
+        dpr = option.widget.devicePixelRatioF() if option.widget else 1.0
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        key = (
+            f"video-action:{palette.button().color().name()}:"
+            f"{palette.buttonText().color().name()}:{int(hovered)}:"
+            f"{size.width()}x{size.height()}@{dpr}"
+        )
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        pixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(option.font)
+        fill = palette.button().color()
+        if hovered:
+            fill = fill.darker(110)
+        for rect, (_, text) in zip(self._button_rects(QRect(0, 0, size.width(), size.height())), self.ACTIONS):
+            painter.setPen(palette.mid().color())
+            painter.setBrush(fill)
+            radius = rect.height() / 2
+            painter.drawRoundedRect(rect, radius, radius)
+            painter.setPen(palette.buttonText().color())
+            painter.drawText(rect, Qt.AlignCenter, text)
+        painter.end()
+
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def paint(self, painter, option, index):
+        # 先画背景（选中 / 交替行色），再贴按钮图
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        painter.drawPixmap(option.rect.topLeft(), self._button_pixmap(option, option.rect.size()))
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            pos = event.position().toPoint()
+            for rect, (kind, _) in zip(self._button_rects(option.rect), self.ACTIONS):
+                if rect.contains(pos):
+                    self.action_triggered.emit(index.row(), kind)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+
 class VideoQueuePage(QWidget):
     """
     视频队列页面
@@ -28,12 +311,35 @@ class VideoQueuePage(QWidget):
     4. 预览和下载视频
     """
 
+    # 轮询间隔（毫秒）：无状态变化时按倍数退避
+    POLL_MIN_MS = 2000
+    POLL_MAX_MS = 30000
+    POLL_BACKOFF = 1.5
+
+    _poll_requested = Signal(list)  # 发往轮询线程的 task_id 列表
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.app_state = get_app_state()
         self.video_tasks: List[VideoTask] = []
+        self._task_index: Dict[str, VideoTask] = {}  # task_id -> 任务（行号由模型维护）
         self.polling_timer: Optional[QTimer] = None
+        self._polling = False
+        self._generating = False  # 生成线程是否还在提交任务
+        self._poll_interval_ms = self.POLL_MIN_MS
+        self._poll_thread: Optional[QThread] = None
+        self._poller: Optional[PollerWorker] = None
+        self._poll_busy = False            # 是否有一轮轮询尚未返回
+        self._poll_changed = False         # 本轮是否有任务状态变化
+        self._manual_refresh: Set[str] = set()  # 右键单独刷新的任务（出错时弹窗提示）
+        self._pending_rows: List[VideoTask] = []  # 等待批量加入表格的任务
+
+        # 缩略图异步加载：解码在线程池中完成，结果放入 QPixmapCache
+        self._thumb_signals = ThumbnailSignals(self)
+        self._thumb_signals.loaded.connect(self._on_thumbnail_loaded)
+        self._thumb_loading: Set[str] = set()
+        self._thumb_items: Dict[str, List[QStandardItem]] = {}  # 当前对话框中等待缩略图的项
 
         self._init_ui()
 
@@ -101,16 +407,14 @@ class VideoQueuePage(QWidget):
 
         return group
 
-    def _create_task_table(self) -> QTableWidget:
+    def _create_task_table(self) -> QTableView:
         """创建任务表格"""
-        table = QTableWidget()
-        table.setColumnCount(8)
-        table.setHorizontalHeaderLabels([
-            "任务 ID", "诗句", "提示词", "模型", "状态", "时长", "创建时间", "操作"
-        ])
+        self._model = VideoTaskModel(self)
+        table = QTableView()
+        table.setModel(self._model)
 
         # 设置表格属性
-        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
         table.setAlternatingRowColors(True)
 
         # 列宽设置
@@ -124,6 +428,12 @@ class VideoQueuePage(QWidget):
         header.setSectionResizeMode(6, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(7, QHeaderView.ResizeToContents)
 
+        # 操作列由委托绘制按钮
+        table.setMouseTracking(True)
+        self.action_delegate = ActionButtonDelegate(table)
+        self.action_delegate.action_triggered.connect(self._on_action_triggered)
+        table.setItemDelegateForColumn(7, self.action_delegate)
+
         # 右键菜单
         table.setContextMenuPolicy(Qt.CustomContextMenu)
         table.customContextMenuRequested.connect(self._show_context_menu)
@@ -132,13 +442,12 @@ class VideoQueuePage(QWidget):
 
     def _show_context_menu(self, pos):
         """显示右键菜单"""
-        item = self.table.itemAt(pos)
-        if item is None:
+        index = self.table.indexAt(pos)
+        if not index.isValid():
             return
 
-        row = item.row()
-        task_id_item = self.table.item(row, 0)
-        task_id = task_id_item.text()
+        row = index.row()
+        task_id = self._model.task_at(row).task_id
 
         menu = QMenu(self)
 
@@ -160,6 +469,13 @@ class VideoQueuePage(QWidget):
 
         menu.exec_(self.table.mapToGlobal(pos))
 
+    def _on_action_triggered(self, row: int, kind: str):
+        """操作列按钮点击"""
+        if kind == "preview":
+            self._preview_video(row)
+        elif kind == "download":
+            self._download_single_video(row)
+
     def set_image_paths(self, paths: List[str]):
         """设置图片路径列表用于生成视频（无视频提示词）"""
         # 转换为带空视频提示词的格式
@@ -194,9 +510,8 @@ class VideoQueuePage(QWidget):
         from PySide6.QtWidgets import (
             QDialog, QVBoxLayout, QHBoxLayout, QComboBox, QLabel,
             QDialogButtonBox, QRadioButton, QGroupBox, QLineEdit,
-            QScrollArea, QGridLayout, QFrame, QCheckBox
+            QListView
         )
-        from PySide6.QtGui import QPixmap
 
         dialog = QDialog(self)
         dialog.setWindowTitle("视频生成配置")
@@ -221,56 +536,40 @@ class VideoQueuePage(QWidget):
         # 本地图片缩略图网格
         layout.addWidget(QLabel("本地图片 (点击选择/取消选择):"))
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setMinimumHeight(250)
-
-        self.thumbnail_container = QWidget()
-        self.thumbnail_layout = QGridLayout(self.thumbnail_container)
-        self.thumbnail_layout.setSpacing(8)
-
-        # 存储缩略图复选框
-        self.image_checkboxes = []
-
-        if hasattr(self, 'image_data') and self.image_data:
-            for i, (path, video_prompt) in enumerate(self.image_data):
-                # 创建缩略图帧
-                frame = QFrame()
-                frame.setFrameStyle(QFrame.Box)
-                frame.setFixedSize(120, 140)
-                frame_layout = QVBoxLayout(frame)
-                frame_layout.setContentsMargins(4, 4, 4, 4)
-
-                # 缩略图
-                pixmap = QPixmap(path)
-                if not pixmap.isNull():
-                    scaled = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    img_label = QLabel()
-                    img_label.setPixmap(scaled)
-                    img_label.setAlignment(Qt.AlignCenter)
-                    frame_layout.addWidget(img_label)
-
-                # 复选框
-                checkbox = QCheckBox()
-                checkbox.setChecked(True)  # 默认全选
-                checkbox.setProperty("image_path", path)
-                checkbox.setProperty("video_prompt", video_prompt)
-                # 确保 path 是字符串类型
-                path_str = str(path) if not isinstance(path, str) else path
-                path_name = Path(path_str).name
-                tooltip_text = f"{path_name}\n视频提示词: {video_prompt[:50]}..." if video_prompt else path_name
-                checkbox.setToolTip(tooltip_text)
-                frame_layout.addWidget(checkbox, alignment=Qt.AlignCenter)
-
-                self.image_checkboxes.append(checkbox)
-
-                # 添加到网格
-                row = i // 4
-                col = i % 4
-                self.thumbnail_layout.addWidget(frame, row, col)
-
-        scroll.setWidget(self.thumbnail_container)
-        layout.addWidget(scroll)
+        # 只布局可见区域的项，大量图片时打开对话框也不卡顿
+        thumb_view = QListView()
+        thumb_view.setViewMode(QListView.IconMode)
+        thumb_view.setResizeMode(QListView.Adjust)
+        thumb_view.setMovement(QListView.Static)
+        thumb_view.setUniformItemSizes(True)
+        thumb_view.setLayoutMode(QListView.Batched)
+        thumb_view.setBatchSize(40)
+        thumb_view.setIconSize(QSize(THUMB_SIZE, THUMB_SIZE))
+        thumb_view.setGridSize(QSize(THUMB_SIZE + 20, THUMB_SIZE + 40))
+        thumb_view.setSelectionMode(QListView.NoSelection)
+        thumb_view.setMinimumHeight(250)
+
+        thumb_model = QStandardItemModel(thumb_view)
+        for path, video_prompt in getattr(self, 'image_data', None) or []:
+            # 确保 path 是字符串类型
+            path_str = str(path) if not isinstance(path, str) else path
+            path_name = Path(path_str).name
+
+            item = QStandardItem(path_name)
+            item.setEditable(False)
+            item.setCheckable(True)
+            item.setCheckState(Qt.Checked)  # 默认全选
+            item.setData(path, _IMAGE_PATH_ROLE)
+            item.setData(video_prompt, _VIDEO_PROMPT_ROLE)
+            tooltip_text = f"{path_name}\n视频提示词: {video_prompt[:50]}..." if video_prompt else path_name
+            item.setToolTip(tooltip_text)
+            thumb_model.appendRow(item)
+
+            # 缩略图（缓存命中直接显示，否则后台加载）
+            self._request_thumbnail(path_str, item)
+
+        thumb_view.setModel(thumb_model)
+        layout.addWidget(thumb_view)
 
         # URL 输入（默认隐藏）
         self.url_group = QGroupBox("图片 URL")
@@ -319,7 +618,7 @@ class VideoQueuePage(QWidget):
         layout.addWidget(aspect_combo)
 
         # 连接单选按钮
-        self.use_local_radio.toggled.connect(lambda checked: self._toggle_image_source_dialog(scroll, checked))
+        self.use_local_radio.toggled.connect(lambda checked: self._toggle_image_source_dialog(thumb_view, checked))
 
         buttons = QDialogButtonBox(
             QDialogButtonBox.Ok | QDialogButtonBox.Cancel
@@ -328,7 +627,10 @@ class VideoQueuePage(QWidget):
         buttons.rejected.connect(dialog.reject)
         layout.addWidget(buttons)
 
-        if dialog.exec():
+        accepted = dialog.exec()
+        self._thumb_items.clear()  # 对话框关闭后不再回填，加载结果只进缓存
+
+        if accepted:
             # 收集图片路径
             image_paths = []
 
@@ -350,12 +652,13 @@ class VideoQueuePage(QWidget):
                     return
 
             else:
-                # 使用本地图片 - 从复选框获取选中的（包含视频提示词）
+                # 使用本地图片 - 读取勾选的项（包含视频提示词）
                 selected_data = []
-                for checkbox in self.image_checkboxes:
-                    if checkbox.isChecked():
-                        path = checkbox.property("image_path")
-                        video_prompt = checkbox.property("video_prompt") or ""
+                for row in range(thumb_model.rowCount()):
+                    item = thumb_model.item(row)
+                    if item.checkState() == Qt.Checked:
+                        path = item.data(_IMAGE_PATH_ROLE)
+                        video_prompt = item.data(_VIDEO_PROMPT_ROLE) or ""
                         selected_data.append((path, video_prompt))
 
                 if not selected_data:
@@ -369,9 +672,37 @@ class VideoQueuePage(QWidget):
             else:
                 self._start_video_generation(selected_data, model_combo.currentData(), aspect_combo.currentData())
 
-    def _toggle_image_source_dialog(self, scroll_widget, use_local: bool):
+    def _request_thumbnail(self, path: str, item: QStandardItem):
+        """为列表项设置缩略图：缓存命中立即设置，否则提交到线程池"""
+        key = _thumb_key(path)
+        if key is None:
+            return
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            item.setData(pixmap, Qt.DecorationRole)
+            return
+
+        self._thumb_items.setdefault(key, []).append(item)
+        if key not in self._thumb_loading:
+            self._thumb_loading.add(key)
+            QThreadPool.globalInstance().start(ThumbnailTask(key, path, self._thumb_signals))
+
+    def _on_thumbnail_loaded(self, key: str, image: QImage):
+        """缩略图加载完成（UI 线程）"""
+        self._thumb_loading.discard(key)
+        if image.isNull():
+            self._thumb_items.pop(key, None)
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        for item in self._thumb_items.pop(key, []):
+            item.setData(pixmap, Qt.DecorationRole)
+
+    def _toggle_image_source_dialog(self, images_widget, use_local: bool):
         """切换图片来源（对话框内）"""
-        scroll_widget.setVisible(use_local)
+        images_widget.setVisible(use_local)
         self.url_group.setVisible(not use_local)
 
     def _start_video_generation(self, image_data: List[tuple], model: str, aspect_ratio: str):
@@ -388,216 +719,203 @@ class VideoQueuePage(QWidget):
         self._video_thread.task_submitted.connect(self._on_task_submitted)
         self._video_thread.task_updated.connect(self._on_task_updated)
         self._video_thread.finished.connect(self._on_generation_finished)
+        self._generating = True
         self._video_thread.start()
 
         # 启动轮询
         self._start_polling()
 
     def _on_task_submitted(self, task: VideoTask):
-        """任务提交完成"""
+        """任务提交完成（100ms 内连续提交的任务合并为一次表格更新）"""
         self.video_tasks.append(task)
-        self._add_task_to_table(task)
+        self._task_index[task.task_id] = task
+        if not self._pending_rows:
+            QTimer.singleShot(100, self._flush_pending_rows)
+        self._pending_rows.append(task)
         self.refresh_btn.setEnabled(True)
 
+    def _flush_pending_rows(self):
+        """把累积的新任务一次性加入表格"""
+        tasks, self._pending_rows = self._pending_rows, []
+        self._add_tasks_to_table(tasks)
+
     def _on_task_updated(self, task_id: str, status: str):
         """任务状态更新"""
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 0).text() == task_id:
-                # 更新状态
-                status_item = self.table.item(row, 4)
-
-                # 设置颜色映射（包含所有状态）
-                status_colors = {
-                    # 通用状态
-                    VideoTaskStatus.PENDING: "#999999",
-                    VideoTaskStatus.SUBMITTED: "#2196F3",
-                    VideoTaskStatus.QUEUED: "#FF9800",
-                    VideoTaskStatus.PROCESSING: "#9C27B0",
-                    VideoTaskStatus.COMPLETED: "#4CAF50",
-                    VideoTaskStatus.FAILED: "#F44336",
-                    VideoTaskStatus.CANCELLED: "#757575",
-                    VideoTaskStatus.ERROR: "#D32F2F",
-                    # Veo 子状态
-                    VideoTaskStatus.IMAGE_DOWNLOADING: "#7B1FA2",
-                    VideoTaskStatus.VIDEO_GENERATING: "#8E24AA",
-                    VideoTaskStatus.VIDEO_UPSAMPLING: "#AB47BC",
-                }
-
-                # 使用 from_api_status 获取枚举并映射颜色
-                enum_status = VideoTaskStatus.from_api_status(status)
-                color = status_colors.get(enum_status, "#000000")
-
-                # 显示原始状态（更详细的 API 状态）
-                display_status = status.replace("_", " ").title()
-
-                status_item.setText(display_status)
-                status_item.setForeground(QBrush(QColor(color)))
-                status_item.setTextAlignment(Qt.AlignCenter)
-
-                break
+        self._model.update_status(task_id, status)
 
     def _on_generation_finished(self):
         """生成完成"""
+        self._generating = False
         self.stop_polling_btn.setEnabled(False)
 
-    def _add_task_to_table(self, task: VideoTask):
-        """添加任务到表格"""
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        # 任务 ID
-        self.table.setItem(row, 0, QTableWidgetItem(task.task_id))
-
-        # 诗句
-        self.table.setItem(row, 1, QTableWidgetItem(f"诗句 {task.verse_index}"))
-
-        # 提示词
-        prompt_text = str(task.video_prompt)[:50] + "..." if task.video_prompt else ""
-        self.table.setItem(row, 2, QTableWidgetItem(prompt_text))
-
-        # 模型
-        self.table.setItem(row, 3, QTableWidgetItem(task.model))
-
-        # 状态
-        status_item = QTableWidgetItem(task.status.value)
-        self._set_status_color(status_item, task.status)
-        self.table.setItem(row, 4, status_item)
-
-        # 时长
-        duration_text = f"{task.duration:.1f}s" if task.duration else "-"
-        self.table.setItem(row, 5, QTableWidgetItem(duration_text))
-
-        # 创建时间
-        time_text = task.created_at.strftime("%H:%M:%S")
-        self.table.setItem(row, 6, QTableWidgetItem(time_text))
-
-        # 操作按钮
-        btn_widget = QWidget()
-        btn_layout = QHBoxLayout(btn_widget)
-        btn_layout.setContentsMargins(5, 2, 5, 2)
-
-        preview_btn = QPushButton("预览")
-        preview_btn.setMaximumWidth(50)
-        preview_btn.clicked.connect(lambda: self._preview_video(row))
-        btn_layout.addWidget(preview_btn)
-
-        download_btn = QPushButton("下载")
-        download_btn.setMaximumWidth(50)
-        download_btn.clicked.connect(lambda: self._download_single_video(row))
-        btn_layout.addWidget(download_btn)
-
-        self.table.setCellWidget(row, 7, btn_widget)
-
-    def _set_status_color(self, item: QTableWidgetItem, status: VideoTaskStatus):
-        """设置状态颜色"""
-        colors = {
-            # 通用状态
-            VideoTaskStatus.PENDING: "#999999",
-            VideoTaskStatus.SUBMITTED: "#2196F3",
-            VideoTaskStatus.QUEUED: "#FF9800",
-            VideoTaskStatus.PROCESSING: "#9C27B0",
-            VideoTaskStatus.COMPLETED: "#4CAF50",
-            VideoTaskStatus.FAILED: "#F44336",
-            VideoTaskStatus.CANCELLED: "#757575",
-            VideoTaskStatus.ERROR: "#D32F2F",
-            # Veo 子状态
-            VideoTaskStatus.IMAGE_DOWNLOADING: "#7B1FA2",
-            VideoTaskStatus.VIDEO_GENERATING: "#8E24AA",
-            VideoTaskStatus.VIDEO_UPSAMPLING: "#AB47BC",
-        }
-        color = colors.get(status, "#000000")
-        item.setForeground(QBrush(QColor(color)))
-        item.setTextAlignment(Qt.AlignCenter)
+    def _add_tasks_to_table(self, tasks: List[VideoTask]):
+        """批量添加任务到表格（模型一次插入全部行）"""
+        self._model.append_tasks(tasks)
 
     def _start_polling(self):
-        """启动状态轮询"""
+        """启动状态轮询（间隔从 POLL_MIN_MS 开始）"""
         if self.polling_timer is None:
-            self.polling_timer = QTimer()
-            self.polling_timer.timeout.connect(self._refresh_status)
-
-        self.polling_timer.start(5000)  # 5秒间隔
+            # 单次定时器：本轮刷新结束后才安排下一轮，请求不会重叠
+            self.polling_timer = QTimer(self)
+            self.polling_timer.setSingleShot(True)
+            self.polling_timer.timeout.connect(self._poll_once)
+
+        self._polling = True
+        self._poll_interval_ms = self.POLL_MIN_MS
+        if self.isVisible():
+            self.polling_timer.start(self._poll_interval_ms)
         self.stop_polling_btn.setEnabled(True)
         self.status_label.setText("轮询中...")
 
     def _stop_polling(self):
         """停止状态轮询"""
+        self._polling = False
         if self.polling_timer:
             self.polling_timer.stop()
         self.stop_polling_btn.setEnabled(False)
         self.status_label.setText("轮询已停止")
 
-    def _refresh_status(self):
-        """刷新所有任务状态"""
-        if not self.video_tasks:
+    def _poll_once(self):
+        """定时器触发一轮轮询"""
+        if self._poll_busy:
+            # 上一轮（如手动刷新）尚未返回，由其结束时安排下一轮
             return
+        if not self._refresh_status() and self._polling:
+            # 暂时没有可查询的任务（生成线程仍在提交），按最短间隔再检查，不发请求
+            self._poll_changed = True
+            self._schedule_next_poll()
+
+    def _schedule_next_poll(self):
+        """安排下一轮：有状态变化时回到最短间隔，否则按倍数退避"""
+        if self._poll_changed:
+            self._poll_interval_ms = self.POLL_MIN_MS
+        else:
+            self._poll_interval_ms = min(int(self._poll_interval_ms * self.POLL_BACKOFF), self.POLL_MAX_MS)
+        if self._polling and self.isVisible() and not self.polling_timer.isActive():
+            self.polling_timer.start(self._poll_interval_ms)
 
-        pending_tasks = [t for t in self.video_tasks if t.is_processing()]
+    def _ensure_poller(self):
+        """创建常驻轮询线程（首次使用时）"""
+        if self._poll_thread is not None:
+            return
 
-        if not pending_tasks:
-            self._stop_polling()
+        self._poll_thread = QThread(self)
+        self._poll_thread.setObjectName("video-poller")
+        self._poller = PollerWorker(self.app_state)
+        self._poller.moveToThread(self._poll_thread)
+        self._poll_thread.finished.connect(self._poller.deleteLater)
+
+        # 跨线程连接，自动排队执行
+        self._poll_requested.connect(self._poller.poll)
+        self._poller.result_ready.connect(self._on_poll_result)
+        self._poller.error.connect(self._on_poll_error)
+        self._poller.round_finished.connect(self._on_poll_round_finished)
+
+        self._poll_thread.start()
+
+    def _on_poll_result(self, task_id: str, status_data: dict):
+        """收到单个任务的状态（UI 线程）"""
+        task = self._task_index.get(task_id)
+        if task is None:
+            self._manual_refresh.discard(task_id)
             return
 
-        for task in pending_tasks:
-            try:
-                client = self.app_state.video_client
-                status_data = client.get_task_status(task.task_id)
-
-                # 使用 from_api_status 方法解析 API 状态
-                api_status = status_data.get("status", "pending")
-                new_status = VideoTaskStatus.from_api_status(api_status)
-                task.update_status(new_status)
-
-                # 如果完成，设置结果
-                if new_status == VideoTaskStatus.COMPLETED:
-                    task.video_url = status_data.get("video_url")
-                    # 支持多种 duration 字段名
-                    task.duration = (
-                        status_data.get("duration") or
-                        status_data.get("video_duration") or
-                        (status_data.get("completed_at") - task.submit_time.timestamp() if task.submit_time else None)
-                    )
+        try:
+            if self._apply_status(task, status_data):
+                self._poll_changed = True
+        except Exception as e:
+            # 交给错误处理：手动刷新弹窗提示，轮询写日志
+            self._on_poll_error(task_id, str(e))
+            return
+        self._manual_refresh.discard(task_id)
+
+    def _on_poll_error(self, task_id: str, message: str):
+        """查询失败"""
+        if task_id in self._manual_refresh:
+            self._manual_refresh.discard(task_id)
+            QMessageBox.critical(self, "刷新失败", f"刷新失败: {message}")
+        else:
+            self.app_state.logger.error(f"刷新状态失败 {task_id}: {message}")
+
+    def _on_poll_round_finished(self):
+        """一轮查询结束"""
+        if not self._poll_busy:
+            return  # 单独刷新的请求，不影响轮询节奏
+        self._poll_busy = False
+        self._update_progress()
+        if self.polling_timer is not None:
+            self._schedule_next_poll()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 恢复隐藏期间暂停的轮询
+        if self._polling and self.polling_timer and not self.polling_timer.isActive():
+            self.polling_timer.start(self.POLL_MIN_MS)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # 页面不可见时暂停轮询
+        if self.polling_timer:
+            self.polling_timer.stop()
 
-                self._on_task_updated(task.task_id, api_status)
+    def _apply_status(self, task: VideoTask, status_data: dict) -> bool:
+        """把接口返回的状态写入任务并刷新表格，返回状态是否有变化"""
+        # 使用 from_api_status 方法解析 API 状态
+        api_status = status_data.get("status", "pending")
+        new_status = VideoTaskStatus.from_api_status(api_status)
+        changed = new_status != task.status
+        task.update_status(new_status)
+
+        # 如果完成，设置结果
+        if new_status == VideoTaskStatus.COMPLETED:
+            task.video_url = status_data.get("video_url")
+            # 支持多种 duration 字段名
+            task.duration = (
+                status_data.get("duration") or
+                status_data.get("video_duration") or
+                (status_data.get("completed_at") - task.submit_time.timestamp() if task.submit_time else None)
+            )
 
-            except Exception as e:
-                self.app_state.logger.error(f"刷新状态失败 {task.task_id}: {e}")
+        self._on_task_updated(task.task_id, api_status)
+        return changed
+
+    def _refresh_status(self) -> bool:
+        """刷新所有任务状态（在轮询线程中查询，结果逐个回到 UI 线程），返回是否发起了查询"""
+        if self._poll_busy:
+            return False
+
+        pending_ids = [t.task_id for t in self.video_tasks if t.is_processing()]
 
+        if not pending_ids:
+            # 生成线程可能还会提交新任务，此时不停止轮询
+            if not self._generating:
+                self._stop_polling()
+            return False
+
+        self._ensure_poller()
+        self._poll_busy = True
+        self._poll_changed = False
+        self._poll_requested.emit(pending_ids)
+        return True
+
+    def _update_progress(self):
+        """更新底部进度文本"""
         completed = sum(1 for t in self.video_tasks if t.is_finished())
         self.status_label.setText(f"进度: {completed}/{len(self.video_tasks)}")
 
     def _refresh_single_task(self, task_id: str):
         """刷新单个任务状态"""
-        for task in self.video_tasks:
-            if task.task_id == task_id:
-                try:
-                    client = self.app_state.video_client
-                    status_data = client.get_task_status(task_id)
-
-                    # 使用 from_api_status 方法解析 API 状态
-                    api_status = status_data.get("status", "pending")
-                    new_status = VideoTaskStatus.from_api_status(api_status)
-                    task.update_status(new_status)
-
-                    if new_status == VideoTaskStatus.COMPLETED:
-                        task.video_url = status_data.get("video_url")
-                        # 支持多种 duration 字段名
-                        task.duration = (
-                            status_data.get("duration") or
-                            status_data.get("video_duration") or
-                            (status_data.get("completed_at") - task.submit_time.timestamp() if task.submit_time else None)
-                        )
-
-                    self._on_task_updated(task_id, api_status)
-
-                except Exception as e:
-                    QMessageBox.critical(self, "刷新失败", f"刷新失败: {str(e)}")
+        if task_id not in self._task_index:
+            return
 
-                break
+        self._ensure_poller()
+        self._manual_refresh.add(task_id)
+        self._poll_requested.emit([task_id])
 
     def _preview_video(self, row: int):
         """预览视频"""
-        task_id = self.table.item(row, 0).text()
-        task = next((t for t in self.video_tasks if t.task_id == task_id), None)
+        task = self._model.task_at(row)
+        task_id = task.task_id
 
         if task and task.video_url:
             # 提供预览方式选择
@@ -650,8 +968,7 @@ class VideoQueuePage(QWidget):
 
     def _download_single_video(self, row: int):
         """下载单个视频"""
-        task_id = self.table.item(row, 0).text()
-        task = next((t for t in self.video_tasks if t.task_id == task_id), None)
+        task = self._model.task_at(row)
 
         if task and task.video_url:
             directory = QFileDialog.getExistingDirectory(self, "选择保存目录")
@@ -714,7 +1031,7 @@ class VideoQueuePage(QWidget):
 
     def _delete_task(self, row: int):
         """删除任务"""
-        task_id = self.table.item(row, 0).text()
+        task_id = self._model.task_at(row).task_id
 
         reply = QMessageBox.question(
             self,
@@ -725,16 +1042,18 @@ class VideoQueuePage(QWidget):
 
         if reply == QMessageBox.Yes:
             # 从表格中删除
-            self.table.removeRow(row)
-            self.video_tasks = [t for t in self.video_tasks if t.task_id != task_id]
+            self._model.remove_task(row)
+            task = self._task_index.pop(task_id, None)
+            if task is not None:
+                self.video_tasks.remove(task)
 
             # 更新统计
-            self._update_statistics()
+            self._update_progress()
     
     def _on_regenerate_requested(self, task_id: str, new_prompt: str):
         """处理视频重新生成请求"""
         # 查找原任务
-        task = next((t for t in self.video_tasks if t.task_id == task_id), None)
+        task = self._task_index.get(task_id)
         if not task:
             return
         
@@ -750,6 +1069,10 @@ class VideoQueuePage(QWidget):
         """页面关闭时的清理"""
         # 停止轮询
         self._stop_polling()
+        if self._poll_thread is not None:
+            self._poll_thread.requestInterruption()
+            self._poll_thread.quit()
+            self._poll_thread.wait()
         
         # 停止生成线程
         if hasattr(self, '_video_thread') and self._video_thread.isRunning():
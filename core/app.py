@@ -2,7 +2,9 @@
 应用程序核心类
 全局状态管理和应用程序入口
 """
-from typing import Optional
+import copy
+import threading
+from typing import Optional, Tuple
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal
 
@@ -39,6 +41,9 @@ class AppState(QObject):
             self._config_path = Path.home() / '.guui_config.json'
 
         self._config: APIConfig = APIConfig.load(self._config_path)
+        self._config_version = 0  # 每次修改配置加一
+        self._saved_version = 0   # 已写入文件的版本
+        self._save_lock = threading.Lock()
 
         # API 客户端（延迟初始化）
         self._llm_client: Optional[UnifiedClient] = None
@@ -67,23 +72,49 @@ class AppState(QObject):
 
     def update_config(self, **kwargs) -> None:
         """
-        更新配置
+        更新配置并立即写入文件
 
         Args:
             **kwargs: 配置参数
         """
+        snapshot = self.apply_config(**kwargs)
+        self.save_config(snapshot)
+
+    def apply_config(self, **kwargs) -> Tuple[int, APIConfig]:
+        """
+        更新内存中的配置（不写盘），须在 GUI 线程调用
+
+        Args:
+            **kwargs: 配置参数
+
+        Returns:
+            (版本号, 配置快照)，交给 save_config 写盘
+        """
         for key, value in kwargs.items():
             if hasattr(self._config, key):
                 setattr(self._config, key, value)
-
-        # 保存配置
-        self._config.save(self._config_path)
+        self._config_version += 1
+        snapshot = (self._config_version, copy.deepcopy(self._config))
 
         # 重置客户端（下次使用时重新创建）
         self._reset_clients()
 
         self.config_changed.emit()
         self._logger.info(f"配置已更新: {', '.join(kwargs.keys())}")
+        return snapshot
+
+    def save_config(self, snapshot: Tuple[int, APIConfig]) -> None:
+        """
+        把 apply_config 返回的快照写入文件，可在工作线程调用
+
+        写入串行进行；比已写入版本更旧的快照直接跳过，避免覆盖较新的配置。
+        """
+        version, config = snapshot
+        with self._save_lock:
+            if version < self._saved_version:
+                return
+            config.save(self._config_path)
+            self._saved_version = version
 
     def _reset_clients(self) -> None:
         """重置所有客户端"""
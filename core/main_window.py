@@ -585,6 +585,7 @@ class MainWindow(QMainWindow):
                 self.image_page.cleanup()
             if hasattr(self.video_page, 'cleanup'):
                 self.video_page.cleanup()
+            self.settings_panel.cleanup()
 
             # 清理资源
             if self.app_state._llm_client:
@@ -47,6 +47,11 @@ class VersePrompts(BaseModel):
         if 0 <= index < len(self.descriptions):
             self.descriptions.pop(index)
 
+    def remove_descriptions(self, indices) -> None:
+        """批量移除指定索引的描述（一次重建列表）"""
+        indices = set(indices)
+        self.descriptions = [d for i, d in enumerate(self.descriptions) if i not in indices]
+
     def update_description(self, index: int, description: str) -> None:
         """更新指定索引的描述"""
         if 0 <= index < len(self.descriptions):